@@ -0,0 +1,148 @@
+import asyncio
+import math
+import time
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from typing import Deque, Dict
+
+from app.metrics import metrics
+
+
+class Overloaded(Exception):
+    """Raised when a request is refused admission; maps to 429 or 503."""
+
+    def __init__(self, status_code: int, retry_after: int, message: str):
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after
+        self.message = message
+
+
+class TokenBucket:
+    def __init__(self, rate_per_second: float, burst: float):
+        self.rate = rate_per_second
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+
+    def take(self) -> float:
+        """Take one token; return 0 on success or seconds until one is available."""
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+
+class AdmissionController:
+    """Bounded, fair queue in front of an expensive async operation.
+
+    At most ``max_concurrency`` callers run at once and at most ``max_queue``
+    wait. Waiters are queued per client and woken round-robin across clients,
+    so one busy client can't starve the others. Each client is also held to a
+    token-bucket rate limit before it may queue at all.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        max_queue: int,
+        rate_per_second: float,
+        burst: float,
+        max_clients: int = 10_000,
+    ):
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.rate_per_second = rate_per_second
+        self.burst = burst
+        self.max_clients = max_clients
+        self.active = 0
+        self.waiting = 0
+        self._queues: "OrderedDict[str, Deque[asyncio.Future]]" = OrderedDict()
+        self._buckets: "OrderedDict[str, TokenBucket]" = OrderedDict()
+        self._service_seconds = 5.0  # running average, for Retry-After hints
+
+    def _check_rate(self, client_id: str) -> None:
+        bucket = self._buckets.pop(client_id, None)
+        if bucket is None:
+            bucket = TokenBucket(self.rate_per_second, self.burst)
+        self._buckets[client_id] = bucket  # most recently used last
+        while len(self._buckets) > self.max_clients:
+            self._buckets.popitem(last=False)
+        wait = bucket.take()
+        if wait:
+            metrics.inc("generate_rate_limited_total")
+            raise Overloaded(
+                429,
+                math.ceil(wait),
+                "Easy there, bartender! You’re mixing too fast. Take a sip and try again shortly.",
+            )
+
+    def _retry_after(self) -> int:
+        queued_rounds = (self.waiting + 1) / self.max_concurrency
+        return max(1, math.ceil(queued_rounds * self._service_seconds))
+
+    def _release(self) -> None:
+        # Hand the slot straight to the next waiter, round-robin over clients
+        while self._queues:
+            client_id, waiters = self._queues.popitem(last=False)
+            waiter = waiters.popleft()
+            if waiters:
+                self._queues[client_id] = waiters
+            if not waiter.done():
+                self.waiting -= 1
+                waiter.set_result(None)
+                return
+        self.active -= 1
+
+    def _update_gauges(self) -> None:
+        metrics.set("generate_in_flight", self.active)
+        metrics.set("generate_queue_depth", self.waiting)
+
+    @asynccontextmanager
+    async def admit(self, client_id: str, timeout: float):
+        self._check_rate(client_id)
+        if self.active < self.max_concurrency and not self.waiting:
+            self.active += 1
+        else:
+            if self.waiting >= self.max_queue:
+                metrics.inc("generate_queue_full_total")
+                raise Overloaded(
+                    503,
+                    self._retry_after(),
+                    "The bar is packed right now! Please try again in a moment.",
+                )
+            waiter = asyncio.get_running_loop().create_future()
+            self._queues.setdefault(client_id, deque()).append(waiter)
+            self.waiting += 1
+            self._update_gauges()
+            try:
+                await asyncio.wait_for(waiter, timeout)
+            except BaseException as error:
+                if waiter.done() and not waiter.cancelled():
+                    # The slot was handed over just as we gave up: pass it on
+                    self._release()
+                else:
+                    waiter.cancel()
+                    self.waiting -= 1
+                self._update_gauges()
+                if isinstance(error, asyncio.TimeoutError):
+                    metrics.inc("generate_queue_timeouts_total")
+                    raise Overloaded(
+                        503,
+                        self._retry_after(),
+                        "The bar is packed right now! Please try again in a moment.",
+                    ) from None
+                raise
+
+        self._update_gauges()
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            elapsed = time.monotonic() - started
+            self._service_seconds = 0.9 * self._service_seconds + 0.1 * elapsed
+            self._release()
+            self._update_gauges()
@@ -0,0 +1,91 @@
+import gzip
+import hashlib
+import threading
+from typing import Dict, List, Optional, Tuple
+
+import brotli
+from pydantic import TypeAdapter
+
+from app.models import ChooseIngredient
+
+ingredient_list_adapter = TypeAdapter(List[ChooseIngredient])
+
+
+def parse_accept_encoding(header: str) -> Dict[str, float]:
+    """Turn an Accept-Encoding header into a {coding: q-value} mapping."""
+    encodings: Dict[str, float] = {}
+    for part in header.split(","):
+        coding, _, params = part.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        encodings[coding] = q
+    return encodings
+
+
+class CatalogCache:
+    """Serialized, precompressed copy of a static list served as JSON.
+
+    The payload is rebuilt only when the source list changes, so every
+    request is a dictionary lookup instead of a full serialization.
+    """
+
+    def __init__(self, source: List[ChooseIngredient]):
+        self.source = source
+        self._lock = threading.Lock()
+        self._fingerprint: Optional[Tuple[Tuple[str, int], ...]] = None
+        # coding -> (etag, body); swapped as a whole so readers never mix versions
+        self._variants: Dict[str, Tuple[str, bytes]] = {}
+
+    def _current_fingerprint(self) -> Tuple[Tuple[str, int], ...]:
+        return tuple((item.name, item.imageId) for item in self.source)
+
+    def refresh(self) -> Dict[str, Tuple[str, bytes]]:
+        fingerprint = self._current_fingerprint()
+        with self._lock:
+            if fingerprint != self._fingerprint:
+                raw = ingredient_list_adapter.dump_json(self.source)
+                digest = hashlib.sha256(raw).hexdigest()[:32]
+                bodies = {
+                    "identity": raw,
+                    "gzip": gzip.compress(raw, mtime=0),
+                    "br": brotli.compress(raw),
+                }
+                # Strong validators must differ per content-coding
+                self._variants = {
+                    coding: (
+                        (
+                            f'"{digest}"'
+                            if coding == "identity"
+                            else f'"{digest}-{coding}"'
+                        ),
+                        body,
+                    )
+                    for coding, body in bodies.items()
+                }
+                self._fingerprint = fingerprint
+            return self._variants
+
+    @staticmethod
+    def negotiate(variants: Dict[str, Tuple[str, bytes]], accept_encoding: str) -> str:
+        """Pick the smallest encoding the client accepts."""
+        accepted = parse_accept_encoding(accept_encoding)
+        wildcard = accepted.get("*", 0.0)
+        for coding in ("br", "gzip"):
+            if coding in variants and accepted.get(coding, wildcard) > 0:
+                return coding
+        return "identity"
+
+    def get(self, accept_encoding: str) -> Tuple[str, bytes, str, List[str]]:
+        """Return (etag, body, content-coding, all etags) for an Accept-Encoding."""
+        variants = self.refresh()
+        coding = self.negotiate(variants, accept_encoding)
+        etag, body = variants[coding]
+        return etag, body, coding, [tag for tag, _ in variants.values()]
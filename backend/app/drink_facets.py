@@ -0,0 +1,155 @@
+import heapq
+import itertools
+import threading
+from collections import Counter
+from contextlib import ExitStack
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from app.drink_similarity import normalize_ingredient_name
+from app.models import (
+    BooleanFacet,
+    DrinkFacets,
+    DrinkRecipe,
+    DrinkType,
+    IngredientFacet,
+    TypeFacet,
+)
+
+# One cell per combination of the filterable fields
+Cell = Tuple[DrinkType, bool, bool]  # (type, alcoholContent, isFavorite)
+ALL_CELLS: List[Cell] = list(itertools.product(DrinkType, (True, False), (True, False)))
+
+
+def drink_cell(drink: DrinkRecipe) -> Cell:
+    return drink.type, drink.alcoholContent, drink.isFavorite
+
+
+def drink_ingredients(drink: DrinkRecipe) -> set:
+    return {normalize_ingredient_name(i.name) for i in drink.ingredients}
+
+
+class CellLocks:
+    """One lock per cell, always taken in ``ALL_CELLS`` order so that callers
+    locking several cells never deadlock."""
+
+    def __init__(self):
+        self._locks = {cell: threading.Lock() for cell in ALL_CELLS}
+        self._order = {cell: i for i, cell in enumerate(ALL_CELLS)}
+
+    def __call__(self, cells: Iterable[Cell]) -> ExitStack:
+        stack = ExitStack()
+        for cell in sorted(set(cells), key=self._order.__getitem__):
+            stack.enter_context(self._locks[cell])
+        return stack
+
+
+class DrinkFacetIndex:
+    """Facet counters for the catalog, kept up to date as drinks change.
+
+    Drinks are counted per cell of (type, alcoholContent, isFavorite), with
+    an ingredient counter for each cell. Adding a drink or toggling a
+    favorite moves one drink between cells in O(ingredients), and a facet
+    query only walks the few dozen cells, never the drinks themselves.
+
+    Each facet is counted with every *other* active filter applied, so the
+    numbers say how many drinks the user would get by changing that filter.
+
+    Every cell has its own lock, so updates only lock the cells the drink
+    leaves and enters, and toggles on unrelated cells run side by side.
+    Queries lock all cells to read one consistent snapshot.
+    """
+
+    def __init__(self):
+        self._locked = CellLocks()
+        self._cells: Dict[Cell, int] = dict.fromkeys(ALL_CELLS, 0)
+        self._ingredients: Dict[Cell, Counter] = {cell: Counter() for cell in ALL_CELLS}
+        self._labels: Dict[str, str] = {}
+
+    def rebuild(self, drinks: List[DrinkRecipe]) -> None:
+        with self._locked(ALL_CELLS):
+            for cell in ALL_CELLS:
+                self._cells[cell] = 0
+                self._ingredients[cell].clear()
+            self._labels.clear()
+            for drink in drinks:
+                self._count(drink, 1)
+
+    def add(self, drinks: List[DrinkRecipe]) -> None:
+        with self._locked(drink_cell(drink) for drink in drinks):
+            for drink in drinks:
+                self._count(drink, 1)
+
+    def update(self, before: DrinkRecipe, after: DrinkRecipe) -> None:
+        with self._locked([drink_cell(before), drink_cell(after)]):
+            self._count(before, -1)
+            self._count(after, 1)
+
+    def _count(self, drink: DrinkRecipe, delta: int) -> None:
+        cell = drink_cell(drink)
+        self._cells[cell] += delta
+        ingredients = self._ingredients[cell]
+        for ingredient in drink.ingredients:
+            self._labels.setdefault(
+                normalize_ingredient_name(ingredient.name), ingredient.name
+            )
+        for key in drink_ingredients(drink):
+            ingredients[key] += delta
+            if not ingredients[key]:
+                del ingredients[key]
+
+    def facets(
+        self,
+        drink_type: Optional[DrinkType] = None,
+        alcohol_content: Optional[bool] = None,
+        is_favorite: Optional[bool] = None,
+        top: int = 10,
+    ) -> DrinkFacets:
+        wanted = (drink_type, alcohol_content, is_favorite)
+
+        def matches(cell: Cell, skip: int = -1) -> bool:
+            return all(
+                want is None or i == skip or value == want
+                for i, (value, want) in enumerate(zip(cell, wanted))
+            )
+
+        with self._locked(ALL_CELLS):
+            cells = [(cell, n) for cell, n in self._cells.items() if n > 0]
+            by_type: Counter = Counter()
+            by_alcohol: Counter = Counter()
+            by_favorite: Counter = Counter()
+            ingredients: Counter = Counter()
+            total = 0
+            for cell, n in cells:
+                if matches(cell, skip=0):
+                    by_type[cell[0]] += n
+                if matches(cell, skip=1):
+                    by_alcohol[cell[1]] += n
+                if matches(cell, skip=2):
+                    by_favorite[cell[2]] += n
+                if matches(cell):
+                    total += n
+                    ingredients.update(self._ingredients[cell])
+            top_ingredients = heapq.nsmallest(
+                top, ingredients.items(), key=lambda item: (-item[1], item[0])
+            )
+            labels = [(self._labels[key], n) for key, n in top_ingredients]
+
+        return DrinkFacets(
+            total=total,
+            type=[
+                TypeFacet(value=value, count=by_type[value])
+                for value in DrinkType
+                if by_type[value]
+            ],
+            alcoholContent=[
+                BooleanFacet(value=value, count=by_alcohol[value])
+                for value in (True, False)
+                if by_alcohol[value]
+            ],
+            isFavorite=[
+                BooleanFacet(value=value, count=by_favorite[value])
+                for value in (True, False)
+                if by_favorite[value]
+            ],
+            ingredients=[IngredientFacet(name=name, count=n) for name, n in labels],
+        )
@@ -0,0 +1,149 @@
+import logging
+import uuid
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from pydantic import TypeAdapter, ValidationError
+
+from app.drink_store import DrinkStore
+from app.metrics import metrics
+from app.models import DrinkRecipe, ImportLineError, ImportReport
+
+logger = logging.getLogger(__name__)
+
+drink_list_adapter = TypeAdapter(List[DrinkRecipe])
+
+
+def describe_error(error: ValidationError) -> str:
+    first = error.errors()[0]
+    location = ".".join(str(part) for part in first["loc"])
+    return f"{location}: {first['msg']}" if location else first["msg"]
+
+
+class DrinkImporter:
+    """Streams NDJSON (one drink recipe per line) into the drink store.
+
+    Lines are validated ``batch_size`` at a time as a single JSON array with
+    a ``TypeAdapter``, which is much cheaper than validating each line on its
+    own; only when a batch fails are its lines re-validated one by one to
+    find the bad ones. Valid drinks of a batch are stored with one
+    ``extend``, so indexes are updated once per batch. At most
+    ``max_errors`` line errors are kept for the report.
+
+    A line split across chunks is collected piece by piece and joined once
+    its newline arrives; a line longer than ``max_line_bytes`` is dropped as
+    soon as it gets too long and reported as an error.
+    """
+
+    def __init__(
+        self,
+        store: DrinkStore,
+        batch_size: int,
+        max_errors: int,
+        max_line_bytes: int,
+    ):
+        self.store = store
+        self.batch_size = batch_size
+        self.max_errors = max_errors
+        self.max_line_bytes = max_line_bytes
+        self.report = ImportReport(imported=0, failed=0, errors=[])
+        self._partial: List[bytes] = []
+        self._partial_size = 0
+        self._oversized = False
+        self._line_number = 0
+        self._pending: List[Tuple[int, bytes]] = []
+
+    def feed(self, chunk: bytes) -> None:
+        lines: List[Optional[bytes]] = chunk.split(b"\n")
+        tail = lines.pop()  # incomplete until the next newline
+        if lines:
+            lines[0] = self._complete(lines[0])
+            self._queue(lines)
+        self._hold(tail)
+
+    def finish(self) -> ImportReport:
+        self._queue([self._complete(b"")])
+        self._flush()
+        logger.info(
+            "Drink import finished: %d imported, %d failed",
+            self.report.imported,
+            self.report.failed,
+        )
+        return self.report
+
+    def _hold(self, piece: bytes) -> None:
+        if self._oversized or not piece:
+            return
+        self._partial.append(piece)
+        self._partial_size += len(piece)
+        if self._partial_size > self.max_line_bytes:
+            self._oversized = True
+            self._partial, self._partial_size = [], 0
+
+    def _complete(self, piece: bytes) -> Optional[bytes]:
+        """Finish the pending line with ``piece``; None if it was too long."""
+        if self._oversized:
+            self._oversized = False
+            return None
+        line = b"".join(self._partial + [piece]) if self._partial else piece
+        self._partial, self._partial_size = [], 0
+        return line
+
+    def _queue(self, lines: Iterable[Optional[bytes]]) -> None:
+        for line in lines:
+            self._line_number += 1
+            if line is None or len(line) > self.max_line_bytes:
+                self._reject(
+                    self._line_number,
+                    f"Line is longer than {self.max_line_bytes} bytes",
+                )
+            elif line.strip():
+                self._pending.append((self._line_number, line))
+                if len(self._pending) >= self.batch_size:
+                    self._flush()
+
+    def _flush(self) -> None:
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, []
+        drinks = list(self._validate(batch))
+        for drink in drinks:
+            drink.id = uuid.uuid4()
+        self.store.extend(drinks)
+
+        self.report.imported += len(drinks)
+        metrics.inc("drinks_imported_total", len(drinks))
+        logger.info(
+            "Drink import progress: %d imported, %d failed, line %d",
+            self.report.imported,
+            self.report.failed,
+            batch[-1][0],
+        )
+
+    def _validate(self, batch: List[Tuple[int, bytes]]) -> Iterator[DrinkRecipe]:
+        try:
+            drinks = drink_list_adapter.validate_json(
+                b"[" + b",".join(line for _, line in batch) + b"]"
+            )
+        except ValidationError:
+            pass
+        else:
+            # A line like "{...},{...}" would smuggle in an extra drink
+            if len(drinks) == len(batch):
+                yield from drinks
+                return
+
+        for line_number, line in batch:
+            try:
+                yield DrinkRecipe.model_validate_json(line)
+            except ValidationError as error:
+                self._reject(line_number, describe_error(error))
+
+    def _reject(self, line_number: int, message: str) -> None:
+        self.report.failed += 1
+        metrics.inc("drinks_import_failed_total")
+        if len(self.report.errors) < self.max_errors:
+            self.report.errors.append(
+                ImportLineError(line=line_number, message=message)
+            )
+        else:
+            self.report.errorsTruncated = True
@@ -0,0 +1,184 @@
+import bisect
+import itertools
+import random
+from typing import Dict, FrozenSet, Iterator, List, Optional, Sequence, Tuple
+
+from app.drink_facets import ALL_CELLS, Cell, CellLocks, drink_cell
+from app.drink_similarity import normalize_ingredient_name
+from app.models import DrinkRecipe, DrinkType
+
+# Drinks a multi-ingredient pick may skip for missing one of the other
+# ingredients; below this the scan is exhaustive, so a match is always found
+MAX_REJECTIONS = 10_000
+
+
+def random_order(rows: Sequence[int], rng: random.Random) -> Iterator[int]:
+    """Lazily yield ``rows`` in random order without copying them.
+
+    A Fisher-Yates shuffle that records its swaps in a dict, so taking the
+    first few items costs O(items taken) regardless of ``len(rows)``.
+    """
+    swapped: Dict[int, int] = {}
+    for i in range(len(rows)):
+        j = rng.randrange(i, len(rows))
+        yield swapped.get(j, rows[j])
+        swapped[j] = swapped.get(i, rows[i])
+
+
+class RowBucket:
+    """Rows in a cell, with each row's position for O(1) swap-remove."""
+
+    def __init__(self):
+        self.rows: List[int] = []
+        self.positions: Dict[int, int] = {}
+
+    def add(self, row: int) -> None:
+        self.positions[row] = len(self.rows)
+        self.rows.append(row)
+
+    def remove(self, row: int) -> None:
+        position = self.positions.pop(row)
+        last = self.rows.pop()
+        if last != row:
+            self.rows[position] = last
+            self.positions[last] = position
+
+
+class ConcatRows(Sequence):
+    """Read-only view of several row lists as one sequence."""
+
+    def __init__(self, parts: List[List[int]]):
+        self.parts = parts
+        self.ends = list(itertools.accumulate(len(part) for part in parts))
+
+    def __len__(self) -> int:
+        return self.ends[-1] if self.ends else 0
+
+    def __getitem__(self, index: int) -> int:
+        part = bisect.bisect_right(self.ends, index)
+        start = self.ends[part - 1] if part else 0
+        return self.parts[part][index - start]
+
+
+class DrinkSampler:
+    """Random drink picks, optionally restricted by type, alcohol content,
+    favorite flag and ingredients.
+
+    Drinks are bucketed per (type, alcoholContent, isFavorite) cell and per
+    (cell, ingredient), so the three field filters just select cells, and a
+    single ingredient selects that ingredient's bucket in each of them: every
+    drawn drink matches. Toggling a favorite swap-removes the drink from its
+    old cell's buckets into the new ones. With several ingredients, picks
+    draw from the smallest ingredient's buckets and skip drinks missing the
+    others, scanning at most ``MAX_REJECTIONS`` of them.
+
+    Each cell has its own lock, which also guards its ingredient buckets: a
+    toggle locks the two cells it moves the drink between, and a pick locks
+    only the cells its filters select. Rows are append-only between rebuilds.
+    """
+
+    def __init__(self, rng: Optional[random.Random] = None):
+        self._rng = rng or random.Random()
+        self._locked = CellLocks()
+        self.rebuild([])
+
+    def rebuild(self, drinks: List[DrinkRecipe]) -> None:
+        with self._locked(ALL_CELLS):
+            self._drinks: List[DrinkRecipe] = []
+            # Keyed by object identity: ids may be missing or duplicated
+            self._rows: Dict[int, int] = {}
+            self._cell_of: List[Cell] = []
+            self._ingredients_of: List[FrozenSet[str]] = []
+            self._cells: Dict[Cell, RowBucket] = {
+                cell: RowBucket() for cell in ALL_CELLS
+            }
+            self._by_ingredient: Dict[Tuple[Cell, str], RowBucket] = {}
+            self._add_rows(drinks)
+
+    def add(self, drinks: List[DrinkRecipe]) -> None:
+        with self._locked(drink_cell(drink) for drink in drinks):
+            self._add_rows(drinks)
+
+    def update(self, before: DrinkRecipe, after: DrinkRecipe) -> None:
+        old, new = drink_cell(before), drink_cell(after)
+        if old == new:
+            return
+        with self._locked([old, new]):
+            row = self._rows.get(id(after))
+            if row is None or self._cell_of[row] != old:
+                return
+            self._unfile(row)
+            self._cell_of[row] = new
+            self._file(row)
+
+    def _add_rows(self, drinks: List[DrinkRecipe]) -> None:
+        for drink in drinks:
+            row = len(self._drinks)
+            self._drinks.append(drink)
+            self._rows[id(drink)] = row
+            self._cell_of.append(drink_cell(drink))
+            self._ingredients_of.append(
+                frozenset(normalize_ingredient_name(i.name) for i in drink.ingredients)
+            )
+            self._file(row)
+
+    def _file(self, row: int) -> None:
+        cell = self._cell_of[row]
+        self._cells[cell].add(row)
+        for key in self._ingredients_of[row]:
+            self._by_ingredient.setdefault((cell, key), RowBucket()).add(row)
+
+    def _unfile(self, row: int) -> None:
+        cell = self._cell_of[row]
+        self._cells[cell].remove(row)
+        for key in self._ingredients_of[row]:
+            self._by_ingredient[cell, key].remove(row)
+
+    def sample(
+        self,
+        count: int,
+        drink_type: Optional[DrinkType] = None,
+        alcohol_content: Optional[bool] = None,
+        is_favorite: Optional[bool] = None,
+        ingredients: Sequence[str] = (),
+    ) -> List[DrinkRecipe]:
+        """Up to ``count`` distinct random drinks matching every filter."""
+        wanted = (drink_type, alcohol_content, is_favorite)
+        cells = [
+            cell
+            for cell in ALL_CELLS
+            if all(want is None or value == want for value, want in zip(cell, wanted))
+        ]
+        ingredient_keys = {normalize_ingredient_name(name) for name in ingredients}
+
+        picked: List[DrinkRecipe] = []
+        if count <= 0:
+            return picked
+        with self._locked(cells):
+            candidates = ConcatRows([self._cells[cell].rows for cell in cells])
+            if ingredient_keys:
+                candidates = min(
+                    (
+                        ConcatRows(
+                            [
+                                self._by_ingredient[cell, key].rows
+                                for cell in cells
+                                if (cell, key) in self._by_ingredient
+                            ]
+                        )
+                        for key in ingredient_keys
+                    ),
+                    key=len,
+                )
+
+            misses = 0
+            for row in random_order(candidates, self._rng):
+                if ingredient_keys <= self._ingredients_of[row]:
+                    picked.append(self._drinks[row])
+                    if len(picked) == count:
+                        break
+                else:
+                    misses += 1
+                    if misses >= MAX_REJECTIONS:
+                        break
+            return picked
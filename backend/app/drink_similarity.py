@@ -0,0 +1,110 @@
+import threading
+from array import array
+from typing import Dict, List, Optional
+from uuid import UUID
+
+import numpy as np
+
+from app.models import DrinkRecipe, SimilarityMetric
+
+
+def normalize_ingredient_name(name: str) -> str:
+    return " ".join(name.lower().split())
+
+
+class DrinkSimilarityIndex:
+    """Sparse drink x ingredient matrix for "you might also like" lookups.
+
+    The matrix is stored column-wise: every ingredient has a posting list of
+    the drinks (rows) that use it. Scoring a drink is a sparse product of its
+    row with the matrix, done with ``np.bincount`` over the postings of its own
+    ingredients, followed by a vectorised top-k with ``np.argpartition``.
+
+    Postings, row sizes and norms live in growable ``array`` buffers so new
+    drinks are appended in amortised O(1) and queries read them through
+    zero-copy NumPy views.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.rebuild([])
+
+    def rebuild(self, drinks: List[DrinkRecipe]) -> None:
+        with self._lock:
+            self._columns: Dict[str, int] = {}
+            self._postings: List[array] = []
+            self._row_columns: List[List[int]] = []
+            self._sizes = array("d")
+            self._norms = array("d")
+            self._drinks: List[DrinkRecipe] = []
+            self._row_by_id: Dict[UUID, int] = {}
+            self._append_rows(drinks)
+
+    def add(self, drinks: List[DrinkRecipe]) -> None:
+        with self._lock:
+            self._append_rows(drinks)
+
+    def update(self, before: DrinkRecipe, after: DrinkRecipe) -> None:
+        pass  # only isFavorite changes in place, which doesn't affect similarity
+
+    def _append_rows(self, drinks: List[DrinkRecipe]) -> None:
+        for drink in drinks:
+            row = len(self._drinks)
+            columns = set()
+            for ingredient in drink.ingredients:
+                name = normalize_ingredient_name(ingredient.name)
+                column = self._columns.get(name)
+                if column is None:
+                    column = self._columns[name] = len(self._postings)
+                    self._postings.append(array("q"))
+                columns.add(column)
+            for column in columns:
+                self._postings[column].append(row)
+            self._row_columns.append(sorted(columns))
+            self._sizes.append(len(columns))
+            self._norms.append(len(columns) ** 0.5)
+            self._drinks.append(drink)
+            if drink.id is not None:
+                self._row_by_id[drink.id] = row
+
+    def similar(
+        self,
+        drink_id: UUID,
+        k: int,
+        metric: SimilarityMetric = SimilarityMetric.COSINE,
+    ) -> Optional[List[DrinkRecipe]]:
+        """Top-k most similar drinks, or None if the drink is unknown."""
+        with self._lock:
+            row = self._row_by_id.get(drink_id)
+            if row is None:
+                return None
+            total = len(self._drinks)
+            columns = self._row_columns[row]
+            if not columns or k <= 0:
+                return []
+
+            # Shared-ingredient count with every drink (row x matrix product)
+            postings = np.concatenate(
+                [np.frombuffer(self._postings[c], dtype=np.int64) for c in columns]
+            )
+            shared = np.bincount(postings, minlength=total).astype(np.float64)
+            shared[row] = 0.0
+            candidates = np.flatnonzero(shared)
+            if candidates.size == 0:
+                return []
+
+            overlap = shared[candidates]
+            if metric == SimilarityMetric.JACCARD:
+                sizes = np.frombuffer(self._sizes, dtype=np.float64)[candidates]
+                scores = overlap / (len(columns) + sizes - overlap)
+            else:
+                norms = np.frombuffer(self._norms, dtype=np.float64)[candidates]
+                scores = overlap / (self._norms[row] * norms)
+
+            if candidates.size > k:
+                top = np.argpartition(-scores, k - 1)[:k]
+            else:
+                top = np.arange(candidates.size)
+            # Highest score first, ties broken by insertion order
+            top = top[np.lexsort((candidates[top], -scores[top]))]
+            return [self._drinks[i] for i in candidates[top].tolist()]
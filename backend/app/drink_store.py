@@ -0,0 +1,178 @@
+import threading
+from contextlib import ExitStack
+from typing import Callable, Dict, Iterable, List, Optional, Protocol, Set, Tuple
+from uuid import UUID
+
+from app.models import DrinkRecipe
+
+# Independent locks for field updates; drinks hash onto one of them
+LOCK_STRIPES = 64
+
+
+class DrinkIndex(Protocol):
+    """Something kept in sync with the drink store (search, counters, ...).
+
+    ``update`` runs under the drink's stripe only, concurrently for other
+    drinks, so indexes should lock just the part of their state it touches.
+    """
+
+    def add(self, drinks: List[DrinkRecipe]) -> None: ...
+
+    def rebuild(self, drinks: List[DrinkRecipe]) -> None: ...
+
+    def update(self, before: DrinkRecipe, after: DrinkRecipe) -> None: ...
+
+
+class VersionConflict(Exception):
+    def __init__(self, current_version: int):
+        super().__init__(f"Drink is at version {current_version}")
+        self.current_version = current_version
+
+
+class DrinkStore(list):
+    """In-memory drink list that keeps its secondary indexes up to date.
+
+    Appends are forwarded to every index as a batch; any other structural
+    change (clear, remove, slicing, ...) makes the indexes rebuild from scratch.
+    Field changes must go through ``update`` so indexes see old and new values.
+
+    Every drink has a version, bumped on each update, for optimistic
+    concurrency. Updates lock only the drink's stripe, so changes to
+    different drinks don't wait on each other; structural changes take a
+    store lock plus the stripes of the drinks they touch (all stripes for a
+    rebuild), always in the same order, so updates never see a drink that
+    is half-way into the indexes.
+    """
+
+    def __init__(self, drinks: Iterable[DrinkRecipe] = (), stripes: int = LOCK_STRIPES):
+        super().__init__(drinks)
+        self._indexes: List[DrinkIndex] = []
+        self._structure_lock = threading.RLock()
+        self._stripes = [threading.Lock() for _ in range(stripes)]
+        self._by_id: Dict[UUID, DrinkRecipe] = {}
+        self._versions: Dict[UUID, int] = {}
+        self._reindex_ids()
+
+    def _stripe(self, drink_id: Optional[UUID]) -> int:
+        return hash(drink_id) % len(self._stripes)
+
+    def _locked(self, stripes: Iterable[int]) -> ExitStack:
+        stack = ExitStack()
+        for stripe in sorted(set(stripes)):
+            stack.enter_context(self._stripes[stripe])
+        return stack
+
+    def register(self, index: DrinkIndex) -> DrinkIndex:
+        with self._structure_lock, self._locked(range(len(self._stripes))):
+            self._indexes.append(index)
+            index.rebuild(list(self))
+        return index
+
+    def _reindex_ids(self) -> None:
+        versions, self._by_id, self._versions = self._versions, {}, {}
+        for drink in self:
+            if drink.id is not None:
+                self._by_id[drink.id] = drink
+                self._versions[drink.id] = versions.get(drink.id, 1)
+
+    def _added(self, drinks: List[DrinkRecipe]) -> None:
+        for drink in drinks:
+            if drink.id is not None:
+                self._by_id[drink.id] = drink
+                self._versions[drink.id] = 1
+        for index in self._indexes:
+            index.add(drinks)
+
+    def _changed(self) -> None:
+        self._reindex_ids()
+        snapshot = list(self)
+        for index in self._indexes:
+            index.rebuild(snapshot)
+
+    def get(self, drink_id: UUID) -> Optional[Tuple[DrinkRecipe, int]]:
+        """A consistent copy of the drink and its version, or None."""
+        with self._stripes[self._stripe(drink_id)]:
+            drink = self._by_id.get(drink_id)
+            if drink is None:
+                return None
+            return drink.model_copy(), self._versions[drink_id]
+
+    def update(
+        self,
+        drink_id: UUID,
+        changes: Callable[[DrinkRecipe], dict],
+        if_match: Optional[Set[int]] = None,
+    ) -> Optional[Tuple[DrinkRecipe, int]]:
+        """Atomically apply ``changes(drink)`` and bump the drink's version.
+
+        Returns a copy of the updated drink and its new version, or None if
+        there is no such drink. Raises ``VersionConflict`` when ``if_match``
+        is given and doesn't contain the current version.
+        """
+        with self._stripes[self._stripe(drink_id)]:
+            drink = self._by_id.get(drink_id)
+            if drink is None:
+                return None
+            version = self._versions[drink_id]
+            if if_match is not None and version not in if_match:
+                raise VersionConflict(version)
+            before = drink.model_copy()
+            for field, value in changes(drink).items():
+                setattr(drink, field, value)
+            self._versions[drink_id] = version + 1
+            for index in self._indexes:
+                index.update(before, drink)
+            return drink.model_copy(), version + 1
+
+    def append(self, drink: DrinkRecipe) -> None:
+        with self._structure_lock, self._locked([self._stripe(drink.id)]):
+            super().append(drink)
+            self._added([drink])
+
+    def extend(self, drinks: Iterable[DrinkRecipe]) -> None:
+        drinks = list(drinks)
+        stripes = [self._stripe(drink.id) for drink in drinks]
+        with self._structure_lock, self._locked(stripes):
+            super().extend(drinks)
+            self._added(drinks)
+
+    def __iadd__(self, drinks: Iterable[DrinkRecipe]) -> "DrinkStore":
+        self.extend(drinks)
+        return self
+
+    def _rebuilding(self) -> ExitStack:
+        stack = ExitStack()
+        stack.enter_context(self._structure_lock)
+        stack.enter_context(self._locked(range(len(self._stripes))))
+        return stack
+
+    def insert(self, position, drink: DrinkRecipe) -> None:
+        with self._rebuilding():
+            super().insert(position, drink)
+            self._changed()
+
+    def remove(self, drink: DrinkRecipe) -> None:
+        with self._rebuilding():
+            super().remove(drink)
+            self._changed()
+
+    def pop(self, position=-1) -> DrinkRecipe:
+        with self._rebuilding():
+            drink = super().pop(position)
+            self._changed()
+            return drink
+
+    def clear(self) -> None:
+        with self._rebuilding():
+            super().clear()
+            self._changed()
+
+    def __setitem__(self, key, value) -> None:
+        with self._rebuilding():
+            super().__setitem__(key, value)
+            self._changed()
+
+    def __delitem__(self, key) -> None:
+        with self._rebuilding():
+            super().__delitem__(key)
+            self._changed()
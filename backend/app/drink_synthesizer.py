@@ -0,0 +1,202 @@
+import zlib
+from typing import Dict, List, Tuple
+
+from app.models import (
+    DrinkRecipe,
+    DrinkType,
+    Ingredient,
+    IngredientCategory,
+    Unit,
+)
+
+COFFEE_NAMES = {"Espresso", "Brewed Coffee", "Cold Brew"}
+CITRUS_NAMES = {"Lemon", "Lime", "Orange"}
+BLENDED_FRUIT_NAMES = {
+    "Strawberry",
+    "Banana",
+    "Mango",
+    "Pineapple Chunks",
+    "Blueberries",
+    "Watermelon",
+}
+
+# Fixed portions for ingredients that don't follow their category's default
+PORTIONS: Dict[str, Tuple[float, Unit]] = {
+    "Espresso": (30.0, Unit.MILLILITER),
+    "Matcha Powder": (1.0, Unit.TEASPOON),
+    "Yogurt": (100.0, Unit.GRAM),
+    "Vanilla Ice Cream": (100.0, Unit.GRAM),
+    "Chocolate Ice Cream": (100.0, Unit.GRAM),
+    "Strawberry Ice Cream": (100.0, Unit.GRAM),
+    "Honey": (1.0, Unit.TABLESPOON),
+    "Mint": (6.0, Unit.PIECE),
+    "Basil Leaves": (4.0, Unit.PIECE),
+    "Cinnamon": (1.0, Unit.DASH),
+    "Nutmeg": (1.0, Unit.DASH),
+    "Fresh Ginger": (5.0, Unit.GRAM),
+    "Ice Cubes": (6.0, Unit.PIECE),
+    "Whipped Cream": (2.0, Unit.TABLESPOON),
+    "Maraschino Cherries": (1.0, Unit.PIECE),
+    "Chocolate Shavings": (1.0, Unit.TEASPOON),
+    "Sprinkles": (1.0, Unit.TEASPOON),
+}
+
+CATEGORY_PORTIONS: Dict[IngredientCategory, Tuple[float, Unit]] = {
+    IngredientCategory.SPIRIT: (45.0, Unit.MILLILITER),
+    IngredientCategory.FRUIT: (60.0, Unit.MILLILITER),
+    IngredientCategory.CREAMY: (150.0, Unit.MILLILITER),
+    IngredientCategory.COFFEE_TEA: (150.0, Unit.MILLILITER),
+    IngredientCategory.SWEETENER: (15.0, Unit.MILLILITER),
+    IngredientCategory.MIXER: (1.0, Unit.TOP_UP),
+    IngredientCategory.HERB_SPICE: (1.0, Unit.DASH),
+    IngredientCategory.GARNISH: (1.0, Unit.PIECE),
+}
+
+NAME_ADJECTIVES = [
+    "Sunset",
+    "Golden",
+    "Velvet",
+    "Tropical",
+    "Midnight",
+    "Breezy",
+    "Sparkling",
+    "Sunny",
+]
+
+TYPE_SUFFIXES: Dict[DrinkType, str] = {
+    DrinkType.COCKTAIL: "Cocktail",
+    DrinkType.MOCKTAIL: "Cooler",
+    DrinkType.SHOT: "Shot",
+    DrinkType.SMOOTHIE: "Smoothie",
+    DrinkType.MILKSHAKE: "Milkshake",
+    DrinkType.COFFEE_DRINK: "Coffee",
+    DrinkType.TEA_DRINK: "Tea",
+}
+
+
+def portion(name: str, category: IngredientCategory) -> Tuple[float, Unit]:
+    if name in PORTIONS:
+        return PORTIONS[name]
+    if name in CITRUS_NAMES:
+        return 0.5, Unit.PIECE
+    if name in BLENDED_FRUIT_NAMES:
+        return 80.0, Unit.GRAM
+    return CATEGORY_PORTIONS[category]
+
+
+def listing(names: List[str]) -> str:
+    names = [name.lower() for name in names]
+    if len(names) < 2:
+        return "".join(names)
+    return ", ".join(names[:-1]) + " and " + names[-1]
+
+
+def pick_type(by_category: Dict[IngredientCategory, List[str]]) -> DrinkType:
+    names = {name for group in by_category.values() for name in group}
+    if any("Ice Cream" in name for name in names):
+        return DrinkType.MILKSHAKE
+    if names & COFFEE_NAMES:
+        return DrinkType.COFFEE_DRINK
+    if IngredientCategory.COFFEE_TEA in by_category:
+        return DrinkType.TEA_DRINK
+    if names & BLENDED_FRUIT_NAMES and IngredientCategory.CREAMY in by_category:
+        return DrinkType.SMOOTHIE
+    if IngredientCategory.SPIRIT in by_category:
+        if by_category.keys() <= {
+            IngredientCategory.SPIRIT,
+            IngredientCategory.GARNISH,
+        }:
+            return DrinkType.SHOT
+        return DrinkType.COCKTAIL
+    if names & BLENDED_FRUIT_NAMES:
+        return DrinkType.SMOOTHIE
+    return DrinkType.MOCKTAIL
+
+
+def synthesize_drink(
+    ingredients: List[Tuple[str, IngredientCategory]],
+) -> DrinkRecipe:
+    """Build a complete recipe from validated catalog ingredients.
+
+    Pure rules, no I/O: the same ingredient set always yields the same drink,
+    so it is safe both as an explicit fast mode and as the LLM fallback.
+    """
+    by_category: Dict[IngredientCategory, List[str]] = {}
+    for name, category in ingredients:
+        by_category.setdefault(category, []).append(name)
+    drink_type = pick_type(by_category)
+    blended = drink_type in (DrinkType.SMOOTHIE, DrinkType.MILKSHAKE)
+
+    recipe_ingredients = []
+    for name, category in ingredients:
+        amount, unit = portion(name, category)
+        if category == IngredientCategory.SPIRIT and by_category[category][0] != name:
+            amount = 20.0  # supporting spirits and liqueurs
+        recipe_ingredients.append(Ingredient(name=name, amount=amount, unit=unit))
+
+    herbs = by_category.get(IngredientCategory.HERB_SPICE, [])
+    garnishes = by_category.get(IngredientCategory.GARNISH, [])
+    mixers = by_category.get(IngredientCategory.MIXER, [])
+    muddled = [name for name in herbs if name in ("Mint", "Basil Leaves")]
+    spices = [name for name in herbs if name not in muddled]
+    ice = "Ice Cubes" in garnishes
+    toppings = [name for name in garnishes if name != "Ice Cubes"]
+    body = [
+        name
+        for name, category in ingredients
+        if category
+        not in (
+            IngredientCategory.MIXER,
+            IngredientCategory.GARNISH,
+            IngredientCategory.HERB_SPICE,
+        )
+    ]
+
+    instructions = []
+    if muddled:
+        instructions.append(f"Gently muddle the {listing(muddled)} in the glass.")
+    if blended:
+        instructions.append(f"Add the {listing(body)} to a blender.")
+        if ice:
+            instructions.append("Add the ice cubes.")
+        instructions.append("Blend until smooth and pour into a tall glass.")
+    elif drink_type == DrinkType.SHOT:
+        instructions.append(f"Pour the {listing(body)} into a chilled shot glass.")
+    elif drink_type in (DrinkType.COFFEE_DRINK, DrinkType.TEA_DRINK):
+        instructions.append(f"Combine the {listing(body)} in a mug and stir well.")
+        if ice:
+            instructions.append("Pour over ice cubes to serve it iced.")
+    elif body:
+        instructions.append(
+            f"Shake the {listing(body)} with {'the ice cubes' if ice else 'ice'}."
+        )
+        instructions.append("Strain into a glass filled with fresh ice.")
+    else:
+        instructions.append("Fill a tall glass with ice.")
+    if mixers:
+        instructions.append(f"Top up with {listing(mixers)} and stir gently.")
+    if toppings or spices:
+        instructions.append(f"Finish with {listing(toppings + spices)} and serve.")
+    else:
+        instructions.append("Serve immediately.")
+
+    lead = (
+        by_category.get(IngredientCategory.FRUIT)
+        or by_category.get(IngredientCategory.SPIRIT)
+        or body
+        or mixers
+    )[0]
+    seed = zlib.crc32("|".join(sorted(name for name, _ in ingredients)).encode())
+    adjective = NAME_ADJECTIVES[seed % len(NAME_ADJECTIVES)]
+    name = f"{adjective} {lead} {TYPE_SUFFIXES.get(drink_type, 'Drink')}"
+
+    return DrinkRecipe(
+        id=None,
+        name=name,
+        ingredients=recipe_ingredients,
+        instructions=instructions,
+        alcoholContent=IngredientCategory.SPIRIT in by_category,
+        type=drink_type,
+        imageId=None,
+        isFavorite=False,
+    )
@@ -0,0 +1,153 @@
+import asyncio
+import copy
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import CancelledError, Future, TimeoutError
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class IdempotencyError(Exception):
+    def __init__(self, status_code: int, message: str):
+        super().__init__(message)
+        self.status_code = status_code
+        self.message = message
+
+
+@dataclass
+class IdempotencyRecord:
+    fingerprint: str
+    expires_at: float
+    # Resolves to the stored result; usable from both threads and event loops
+    result: Future = field(default_factory=Future)
+
+
+def fingerprint(*parts: str) -> str:
+    return hashlib.sha256("\0".join(parts).encode()).hexdigest()
+
+
+class IdempotencyStore:
+    """Remembers the outcome of requests sent with an ``Idempotency-Key``.
+
+    The first request with a key runs the work; replays with the same key
+    get a copy of the stored result, or wait for it while it is still in
+    progress. Failed attempts are forgotten so they can be retried. Storage
+    is bounded: entries expire after ``ttl_seconds`` and the oldest are
+    evicted beyond ``max_entries``.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._records: "OrderedDict[Tuple[str, str], IdempotencyRecord]" = OrderedDict()
+
+    def _begin(
+        self, scope: str, key: str, request_fingerprint: str
+    ) -> Tuple[bool, IdempotencyRecord]:
+        now = time.monotonic()
+        with self._lock:
+            # Same TTL for every entry, so the oldest entries expire first
+            while self._records:
+                oldest = next(iter(self._records.values()))
+                if oldest.expires_at > now:
+                    break
+                self._records.popitem(last=False)
+
+            record = self._records.get((scope, key))
+            if record is not None:
+                if record.fingerprint != request_fingerprint:
+                    raise IdempotencyError(
+                        422,
+                        "This Idempotency-Key was already used for a different request.",
+                    )
+                return False, record
+
+            record = IdempotencyRecord(request_fingerprint, now + self.ttl_seconds)
+            self._records[(scope, key)] = record
+            while len(self._records) > self.max_entries:
+                self._records.popitem(last=False)
+            return True, record
+
+    def _finish(self, record: IdempotencyRecord, value: T) -> None:
+        record.expires_at = time.monotonic() + self.ttl_seconds
+        record.result.set_result(copy.deepcopy(value))
+
+    def _abandon(self, scope: str, key: str, record: IdempotencyRecord, error) -> None:
+        with self._lock:
+            if self._records.get((scope, key)) is record:
+                del self._records[(scope, key)]
+        if isinstance(error, Exception):
+            record.result.set_exception(error)
+        else:
+            record.result.cancel()
+
+    @staticmethod
+    def _replayed(record: IdempotencyRecord) -> T:
+        try:
+            return copy.deepcopy(record.result.result(timeout=0))
+        except CancelledError:
+            raise IdempotencyError(
+                409, "The original request was interrupted. Please try again."
+            )
+
+    def run(
+        self,
+        scope: str,
+        key: str,
+        request_fingerprint: str,
+        work: Callable[[], T],
+        timeout: float,
+    ) -> Tuple[T, bool]:
+        """Run ``work`` once per key; returns (result, replayed)."""
+        owner, record = self._begin(scope, key, request_fingerprint)
+        if owner:
+            try:
+                value = work()
+            except BaseException as error:
+                self._abandon(scope, key, record, error)
+                raise
+            self._finish(record, value)
+            return value, False
+        try:
+            record.result.exception(timeout=timeout)
+        except TimeoutError:
+            raise still_processing()
+        except CancelledError:
+            pass
+        return self._replayed(record), True
+
+    async def run_async(
+        self,
+        scope: str,
+        key: str,
+        request_fingerprint: str,
+        work: Callable[[], Awaitable[T]],
+        timeout: float,
+    ) -> Tuple[T, bool]:
+        """Async variant of ``run`` for coroutine work."""
+        owner, record = self._begin(scope, key, request_fingerprint)
+        if owner:
+            try:
+                value = await work()
+            except BaseException as error:
+                self._abandon(scope, key, record, error)
+                raise
+            self._finish(record, value)
+            return value, False
+        done, _ = await asyncio.wait(
+            [asyncio.wrap_future(record.result)], timeout=timeout
+        )
+        if not done:
+            raise still_processing()
+        return self._replayed(record), True
+
+
+def still_processing() -> IdempotencyError:
+    return IdempotencyError(
+        409, "A request with this Idempotency-Key is still being processed."
+    )
@@ -0,0 +1,58 @@
+import asyncio
+import logging
+from typing import Iterable, List
+
+import httpx
+
+from app.models import ImageSearchRequest, WarmupState, WarmupStatus
+
+logger = logging.getLogger(__name__)
+
+
+class ImageWarmup:
+    """Pre-populates the image service cache with searches users will make.
+
+    Runs as a background task at no more than ``requests_per_second`` so it
+    never competes with real traffic for the Pexels quota, and backs off when
+    the image service answers with ``Retry-After``.
+    """
+
+    def __init__(
+        self,
+        service_url: str,
+        names: Iterable[str],
+        count: int,
+        requests_per_second: float,
+    ):
+        self.service_url = service_url
+        self.names: List[str] = list(dict.fromkeys(names))  # dedupe, keep order
+        self.count = count
+        self.interval = 1 / requests_per_second
+        self.status = WarmupStatus(
+            state=WarmupState.DISABLED, total=len(self.names), completed=0, failed=0
+        )
+
+    async def run(self) -> None:
+        self.status.state = WarmupState.RUNNING
+        delay = 0.0
+        async with httpx.AsyncClient(timeout=10) as client:
+            for name in self.names:
+                await asyncio.sleep(delay)
+                delay = self.interval
+                request = ImageSearchRequest(name=name, count=self.count, page=1)
+                try:
+                    response = await client.post(
+                        self.service_url, json=request.model_dump()
+                    )
+                except httpx.HTTPError as error:
+                    logger.info("Image warm-up for %r failed: %r", name, error)
+                    self.status.failed += 1
+                else:
+                    if response.status_code == 200:
+                        self.status.completed += 1
+                    else:
+                        self.status.failed += 1
+                        retry_after = response.headers.get("retry-after", "")
+                        if retry_after.isdigit():
+                            delay = max(delay, float(retry_after))
+        self.status.state = WarmupState.DONE
@@ -0,0 +1,114 @@
+import bisect
+import heapq
+import threading
+from typing import Dict, List, Set, Tuple
+
+from app.drink_similarity import normalize_ingredient_name
+from app.ingredient_validation import IngredientValidator
+from app.models import ChooseIngredient, DrinkRecipe, IngredientSuggestion
+
+# Recipe spellings indexed as extra search terms for their catalog entry
+MAX_ALIASES = 10_000
+
+
+def word_starts(key: str) -> List[str]:
+    """Every suffix of ``key`` that starts a word: "white rum" -> [.., "rum"]."""
+    words = key.split(" ")
+    return [" ".join(words[i:]) for i in range(len(words))]
+
+
+class IngredientAutocomplete:
+    """Type-ahead over catalog ingredients and the ingredients used in drinks.
+
+    Only catalog ingredients are suggested, so every suggestion is accepted
+    by /drinks/generate. A recipe ingredient counts as a use of the catalog
+    entry ``validator`` resolves it to ("White Rum" is Rum), and its spelling
+    becomes a search alias: typing "white" suggests Rum. Recipe names that
+    resolve to nothing are ignored, and at most ``MAX_ALIASES`` spellings
+    are indexed.
+
+    Names are kept in a sorted array of (word suffix, name) pairs, so the
+    candidates for a prefix are one contiguous slice found with ``bisect``,
+    and typing "rum" finds "White Rum" too. Suggestions are ranked by how
+    many drinks use them. Adding drinks only bumps counters, plus merging
+    names never seen before into the array.
+    """
+
+    def __init__(self, catalog: List[ChooseIngredient], validator: IngredientValidator):
+        self.catalog = catalog
+        self.validator = validator
+        self._lock = threading.Lock()
+        self.rebuild([])
+
+    def rebuild(self, drinks: List[DrinkRecipe]) -> None:
+        with self._lock:
+            self._entries: List[Tuple[str, str]] = []
+            self._labels: Dict[str, str] = {}
+            self._uses: Dict[str, int] = {}
+            self._images: Dict[str, int] = {}
+            self._aliases: Set[str] = set()
+            for ingredient in self.catalog:
+                key = self._register(ingredient.name)
+                self._images.setdefault(key, ingredient.imageId)
+            self._entries.sort()
+            self._count(drinks)
+
+    def add(self, drinks: List[DrinkRecipe]) -> None:
+        with self._lock:
+            self._count(drinks)
+
+    def update(self, before: DrinkRecipe, after: DrinkRecipe) -> None:
+        pass  # ingredients aren't edited in place
+
+    def _register(self, name: str) -> str:
+        key = normalize_ingredient_name(name)
+        if key and key not in self._labels:
+            self._labels[key] = name.strip()
+            self._uses[key] = 0
+            # Appended unsorted; _count sorts once per batch
+            self._entries.extend((suffix, key) for suffix in word_starts(key))
+        return key
+
+    def _alias(self, name: str, key: str) -> None:
+        alias = normalize_ingredient_name(name)
+        if alias in self._labels or alias in self._aliases:
+            return
+        if len(self._aliases) < MAX_ALIASES:
+            self._aliases.add(alias)
+            self._entries.extend((suffix, key) for suffix in word_starts(alias))
+
+    def _count(self, drinks: List[DrinkRecipe]) -> None:
+        known = len(self._entries)
+        for drink in drinks:
+            keys = set()
+            for ingredient in drink.ingredients:
+                resolved = self.validator.resolve(ingredient.name)
+                if resolved is not None:
+                    key = self._register(resolved[0])
+                    self._alias(ingredient.name, key)
+                    keys.add(key)
+            keys.discard("")
+            for key in keys:
+                self._uses[key] += 1
+        if len(self._entries) != known:
+            # Timsort merges the new tail into the sorted run in ~linear time
+            self._entries.sort()
+
+    def suggest(self, query: str, limit: int) -> List[IngredientSuggestion]:
+        prefix = normalize_ingredient_name(query)
+        if not prefix:
+            return []
+        with self._lock:
+            start = bisect.bisect_left(self._entries, (prefix,))
+            # U+FFFF sorts after any character a name can continue with
+            end = bisect.bisect_left(self._entries, (prefix + "\uffff",), lo=start)
+            keys = {key for _, key in self._entries[start:end]}
+            best = heapq.nsmallest(limit, keys, key=lambda k: (-self._uses[k], k))
+            return [
+                IngredientSuggestion(
+                    name=self._labels[key],
+                    uses=self._uses[key],
+                    imageId=self._images.get(key),
+                )
+                for key in best
+            ]
@@ -1,75 +1,95 @@
-from typing import List
-from app.models import ChooseIngredient
+from typing import Dict, List
+from app.models import ChooseIngredient, IngredientCategory
 
 # --- In-Memory Store ---
-ingredient_db: List[ChooseIngredient] = [
+ingredient_categories: Dict[IngredientCategory, List[ChooseIngredient]] = {
     # Base spirits & liqueurs
-    ChooseIngredient(name="Vodka", imageId=3738485),
-    ChooseIngredient(name="Rum", imageId=2466319),
-    ChooseIngredient(name="Gin", imageId=1277203),
-    ChooseIngredient(name="Tequila", imageId=7282723),
-    ChooseIngredient(name="Whiskey", imageId=543725),
-    ChooseIngredient(name="Bourbon", imageId=32711956),
-    ChooseIngredient(name="Triple Sec", imageId=11434104),
-    ChooseIngredient(name="Amaretto", imageId=7013985),
-    ChooseIngredient(name="Coffee Liqueur", imageId=24012654),
-    ChooseIngredient(name="Baileys Irish Cream", imageId=29559425),
-    ChooseIngredient(name="Blue Curaçao", imageId=2480828),
+    IngredientCategory.SPIRIT: [
+        ChooseIngredient(name="Vodka", imageId=3738485),
+        ChooseIngredient(name="Rum", imageId=2466319),
+        ChooseIngredient(name="Gin", imageId=1277203),
+        ChooseIngredient(name="Tequila", imageId=7282723),
+        ChooseIngredient(name="Whiskey", imageId=543725),
+        ChooseIngredient(name="Bourbon", imageId=32711956),
+        ChooseIngredient(name="Triple Sec", imageId=11434104),
+        ChooseIngredient(name="Amaretto", imageId=7013985),
+        ChooseIngredient(name="Coffee Liqueur", imageId=24012654),
+        ChooseIngredient(name="Baileys Irish Cream", imageId=29559425),
+        ChooseIngredient(name="Blue Curaçao", imageId=2480828),
+    ],
     # Fruits & juices
-    ChooseIngredient(name="Orange", imageId=691166),
-    ChooseIngredient(name="Pineapple Juice", imageId=8963452),
-    ChooseIngredient(name="Lemon", imageId=1414110),
-    ChooseIngredient(name="Lime", imageId=357577),
-    ChooseIngredient(name="Cranberry Juice", imageId=11066831),
-    ChooseIngredient(name="Apple Juice", imageId=616833),
-    ChooseIngredient(name="Mango Juice", imageId=8679358),
-    ChooseIngredient(name="Grapefruit Juice", imageId=6613046),
-    ChooseIngredient(name="Strawberry", imageId=6944172),
-    ChooseIngredient(name="Banana", imageId=2872767),
-    ChooseIngredient(name="Mango", imageId=918643),
-    ChooseIngredient(name="Pineapple Chunks", imageId=4110334),
-    ChooseIngredient(name="Blueberries", imageId=70862),
-    ChooseIngredient(name="Watermelon", imageId=1337825),
+    IngredientCategory.FRUIT: [
+        ChooseIngredient(name="Orange", imageId=691166),
+        ChooseIngredient(name="Pineapple Juice", imageId=8963452),
+        ChooseIngredient(name="Lemon", imageId=1414110),
+        ChooseIngredient(name="Lime", imageId=357577),
+        ChooseIngredient(name="Cranberry Juice", imageId=11066831),
+        ChooseIngredient(name="Apple Juice", imageId=616833),
+        ChooseIngredient(name="Mango Juice", imageId=8679358),
+        ChooseIngredient(name="Grapefruit Juice", imageId=6613046),
+        ChooseIngredient(name="Strawberry", imageId=6944172),
+        ChooseIngredient(name="Banana", imageId=2872767),
+        ChooseIngredient(name="Mango", imageId=918643),
+        ChooseIngredient(name="Pineapple Chunks", imageId=4110334),
+        ChooseIngredient(name="Blueberries", imageId=70862),
+        ChooseIngredient(name="Watermelon", imageId=1337825),
+    ],
     # Creamy bases
-    ChooseIngredient(name="Milk", imageId=248412),
-    ChooseIngredient(name="Almond Milk", imageId=3735209),
-    ChooseIngredient(name="Coconut Milk", imageId=7676717),
-    ChooseIngredient(name="Oat Milk", imageId=1194427),
-    ChooseIngredient(name="Vanilla Ice Cream", imageId=1294943),
-    ChooseIngredient(name="Chocolate Ice Cream", imageId=126790),
-    ChooseIngredient(name="Strawberry Ice Cream", imageId=2161643),
-    ChooseIngredient(name="Yogurt", imageId=3212808),
+    IngredientCategory.CREAMY: [
+        ChooseIngredient(name="Milk", imageId=248412),
+        ChooseIngredient(name="Almond Milk", imageId=3735209),
+        ChooseIngredient(name="Coconut Milk", imageId=7676717),
+        ChooseIngredient(name="Oat Milk", imageId=1194427),
+        ChooseIngredient(name="Vanilla Ice Cream", imageId=1294943),
+        ChooseIngredient(name="Chocolate Ice Cream", imageId=126790),
+        ChooseIngredient(name="Strawberry Ice Cream", imageId=2161643),
+        ChooseIngredient(name="Yogurt", imageId=3212808),
+    ],
     # Coffee & tea bases
-    ChooseIngredient(name="Espresso", imageId=324028),
-    ChooseIngredient(name="Brewed Coffee", imageId=2878712),
-    ChooseIngredient(name="Cold Brew", imageId=2067404),
-    ChooseIngredient(name="Green Tea", imageId=814264),
-    ChooseIngredient(name="Black Tea", imageId=1493080),
-    ChooseIngredient(name="Chai Tea", imageId=5946616),
-    ChooseIngredient(name="Matcha Powder", imageId=18794175),
+    IngredientCategory.COFFEE_TEA: [
+        ChooseIngredient(name="Espresso", imageId=324028),
+        ChooseIngredient(name="Brewed Coffee", imageId=2878712),
+        ChooseIngredient(name="Cold Brew", imageId=2067404),
+        ChooseIngredient(name="Green Tea", imageId=814264),
+        ChooseIngredient(name="Black Tea", imageId=1493080),
+        ChooseIngredient(name="Chai Tea", imageId=5946616),
+        ChooseIngredient(name="Matcha Powder", imageId=18794175),
+    ],
     # Sweeteners & syrups
-    ChooseIngredient(name="Honey", imageId=302163),
-    ChooseIngredient(name="Maple Syrup", imageId=2059236),
-    ChooseIngredient(name="Simple Syrup", imageId=1189255),
-    ChooseIngredient(name="Chocolate Syrup", imageId=3692869),
-    ChooseIngredient(name="Caramel Syrup", imageId=5060468),
+    IngredientCategory.SWEETENER: [
+        ChooseIngredient(name="Honey", imageId=302163),
+        ChooseIngredient(name="Maple Syrup", imageId=2059236),
+        ChooseIngredient(name="Simple Syrup", imageId=1189255),
+        ChooseIngredient(name="Chocolate Syrup", imageId=3692869),
+        ChooseIngredient(name="Caramel Syrup", imageId=5060468),
+    ],
     # Sodas & mixers
-    ChooseIngredient(name="Club Soda", imageId=18297036),
-    ChooseIngredient(name="Ginger Ale", imageId=29724644),
-    ChooseIngredient(name="Cola", imageId=2983100),
-    ChooseIngredient(name="Tonic", imageId=8131585),
-    ChooseIngredient(name="Lemon-Lime Soda", imageId=31332092),
-    ChooseIngredient(name="Coconut Water", imageId=3293022),
+    IngredientCategory.MIXER: [
+        ChooseIngredient(name="Club Soda", imageId=18297036),
+        ChooseIngredient(name="Ginger Ale", imageId=29724644),
+        ChooseIngredient(name="Cola", imageId=2983100),
+        ChooseIngredient(name="Tonic", imageId=8131585),
+        ChooseIngredient(name="Lemon-Lime Soda", imageId=31332092),
+        ChooseIngredient(name="Coconut Water", imageId=3293022),
+    ],
     # Herbs & spices
-    ChooseIngredient(name="Mint", imageId=1264000),
-    ChooseIngredient(name="Basil Leaves", imageId=1391505),
-    ChooseIngredient(name="Cinnamon", imageId=301669),
-    ChooseIngredient(name="Nutmeg", imageId=672046),
-    ChooseIngredient(name="Fresh Ginger", imageId=128403),
+    IngredientCategory.HERB_SPICE: [
+        ChooseIngredient(name="Mint", imageId=1264000),
+        ChooseIngredient(name="Basil Leaves", imageId=1391505),
+        ChooseIngredient(name="Cinnamon", imageId=301669),
+        ChooseIngredient(name="Nutmeg", imageId=672046),
+        ChooseIngredient(name="Fresh Ginger", imageId=128403),
+    ],
     # Others & garnishes
-    ChooseIngredient(name="Ice Cubes", imageId=434259),
-    ChooseIngredient(name="Whipped Cream", imageId=1006297),
-    ChooseIngredient(name="Maraschino Cherries", imageId=32697739),
-    ChooseIngredient(name="Chocolate Shavings", imageId=4110093),
-    ChooseIngredient(name="Sprinkles", imageId=1578293),
+    IngredientCategory.GARNISH: [
+        ChooseIngredient(name="Ice Cubes", imageId=434259),
+        ChooseIngredient(name="Whipped Cream", imageId=1006297),
+        ChooseIngredient(name="Maraschino Cherries", imageId=32697739),
+        ChooseIngredient(name="Chocolate Shavings", imageId=4110093),
+        ChooseIngredient(name="Sprinkles", imageId=1578293),
+    ],
+}
+
+ingredient_db: List[ChooseIngredient] = [
+    ingredient for group in ingredient_categories.values() for ingredient in group
 ]
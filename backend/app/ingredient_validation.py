@@ -0,0 +1,129 @@
+import difflib
+import re
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from app.models import ChooseIngredient, IngredientCategory
+
+# A drink needs at least one of these; the rest only season or decorate it
+BASE_CATEGORIES = {
+    IngredientCategory.SPIRIT,
+    IngredientCategory.FRUIT,
+    IngredientCategory.CREAMY,
+    IngredientCategory.COFFEE_TEA,
+    IngredientCategory.MIXER,
+}
+
+FUZZY_CUTOFF = 0.8
+
+# Unknown names quoted back in the error message; the rest are only counted
+MAX_LISTED_UNKNOWN = 3
+
+
+class IngredientValidationError(ValueError):
+    def __init__(self, message: str):
+        super().__init__(message)
+        self.message = message
+
+
+def ingredient_key(name: str) -> str:
+    """Lookup key that ignores case, punctuation and spacing."""
+    return re.sub(r"[^0-9a-zÀ-ɏ]+", "", name.lower())
+
+
+def singular_key(key: str) -> str:
+    if key.endswith("ies"):
+        return key[:-3] + "y"
+    return key[:-1] if key.endswith("s") else key
+
+
+class IngredientValidator:
+    """Canonicalizes requested ingredient names against the catalog.
+
+    Exact matches are a single dictionary lookup on a normalized key; anything
+    else falls back to ``difflib`` fuzzy matching, memoized so a repeated typo
+    costs nothing the second time. Only catalog names are ever accepted;
+    ``resolve`` maps recipe spellings such as "White Rum" onto them without
+    widening what ``validate`` lets through.
+    """
+
+    def __init__(self, categories: Dict[IngredientCategory, List[ChooseIngredient]]):
+        self._lookup: Dict[str, Tuple[str, IngredientCategory]] = {}
+        for category, ingredients in categories.items():
+            for ingredient in ingredients:
+                self._lookup[ingredient_key(ingredient.name)] = (
+                    ingredient.name,
+                    category,
+                )
+                # Singular and plural spellings both resolve ("Blueberry")
+                self._lookup.setdefault(
+                    singular_key(ingredient_key(ingredient.name)),
+                    (ingredient.name, category),
+                )
+        self._keys = list(self._lookup)
+        self.match = lru_cache(maxsize=1024)(self._match)
+        self.resolve = lru_cache(maxsize=1024)(self._resolve)
+
+    def _resolve(self, name: str) -> Optional[Tuple[str, IngredientCategory]]:
+        """The catalog ingredient a recipe ingredient is a kind of.
+
+        Names ``match`` accepts resolve to that. Otherwise it's the longest
+        run of words that is a catalog ingredient, preferring the last words
+        ("White Rum" is Rum, "Mint Leaves" is Mint). None when nothing fits.
+        """
+        match = self.match(name)
+        if match is not None:
+            return match
+        words = re.findall(r"[0-9a-zÀ-ɏ]+", name.lower())
+        for size in range(len(words), 0, -1):
+            for start in range(len(words) - size, -1, -1):
+                key = ingredient_key("".join(words[start : start + size]))
+                found = self._lookup.get(key) or self._lookup.get(singular_key(key))
+                if found is not None:
+                    return found
+        return None
+
+    def _match(self, name: str) -> Optional[Tuple[str, IngredientCategory]]:
+        key = ingredient_key(name)
+        if not key:
+            return None
+        exact = self._lookup.get(key) or self._lookup.get(singular_key(key))
+        if exact is not None:
+            return exact
+        close = difflib.get_close_matches(key, self._keys, n=1, cutoff=FUZZY_CUTOFF)
+        return self._lookup[close[0]] if close else None
+
+    def validate(self, names: List[str]) -> List[Tuple[str, IngredientCategory]]:
+        """Return the distinct canonical ingredients, in request order.
+
+        Raises IngredientValidationError when the set can't make a drink.
+        """
+        canonical: Dict[str, IngredientCategory] = {}
+        unknown: List[str] = []
+        for name in names:
+            match = self.match(name)
+            if match is None:
+                if name.strip():
+                    unknown.append(name.strip())
+                continue
+            canonical.setdefault(*match)
+
+        if unknown:
+            listed = ", ".join(f"“{name}”" for name in unknown[:MAX_LISTED_UNKNOWN])
+            if len(unknown) > MAX_LISTED_UNKNOWN:
+                listed += f" and {len(unknown) - MAX_LISTED_UNKNOWN} more"
+            raise IngredientValidationError(
+                "We don’t stock "
+                + listed
+                + " behind the bar. Pick ingredients from the list and try again!"
+            )
+        if not canonical:
+            raise IngredientValidationError(
+                "An empty glass is a little too minimalist. Pick a few ingredients first!"
+            )
+        if not BASE_CATEGORIES.intersection(canonical.values()):
+            raise IngredientValidationError(
+                "That’s all garnish and no drink! Add a spirit, juice, milk, "
+                "coffee, tea or mixer to build on."
+            )
+        return list(canonical.items())
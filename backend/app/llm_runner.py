@@ -0,0 +1,163 @@
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Dict, Optional
+
+from pydantic_ai import Agent
+from pydantic_ai.agent import AgentRunResult
+from pydantic_ai.models import Model
+from pydantic_ai.usage import Usage, UsageLimits
+
+from app.metrics import metrics
+
+
+class RetryBudget:
+    """Token bucket that lets retries be at most a fraction of all traffic.
+
+    Every run deposits ``ratio`` tokens and a slow trickle of
+    ``min_per_second`` keeps a few retries available when traffic is low.
+    Each retry costs one token, so during an outage retries dry up instead of
+    multiplying the load on the upstream.
+    """
+
+    def __init__(self, ratio: float, min_per_second: float, max_tokens: float):
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.max_tokens = max_tokens
+        self._tokens = max_tokens
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, amount: float = 0.0) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            self.max_tokens,
+            self._tokens + (now - self._updated) * self.min_per_second + amount,
+        )
+        self._updated = now
+
+    def deposit(self) -> None:
+        with self._lock:
+            self._refill(self.ratio)
+
+    def reserve(self, wanted: int) -> int:
+        """Take up to ``wanted`` retry tokens and return how many were granted."""
+        with self._lock:
+            self._refill()
+            granted = min(wanted, int(self._tokens))
+            self._tokens -= granted
+            return granted
+
+    def refund(self, unused: int) -> None:
+        with self._lock:
+            self._refill(unused)
+
+    @property
+    def tokens(self) -> float:
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+
+class LatencyTracker:
+    """Rolling window of successful call latencies."""
+
+    def __init__(self, default: float, window: int = 200, min_samples: int = 20):
+        self.default = default
+        self.min_samples = min_samples
+        self._samples: deque = deque(maxlen=window)
+
+    def record(self, seconds: float) -> None:
+        self._samples.append(seconds)
+
+    def p95(self) -> float:
+        samples = sorted(self._samples)
+        if len(samples) < self.min_samples:
+            return self.default
+        return samples[int(len(samples) * 0.95) - 1]
+
+
+class GenerationRunner:
+    """Runs the agent under a deadline, a shared retry budget and hedging.
+
+    When a hedge model is configured and the primary call is slower than the
+    recent p95, a second call goes to the hedge model; whichever answers
+    first wins and the other is cancelled.
+    """
+
+    def __init__(
+        self,
+        agent: Agent,
+        max_retries: int,
+        retry_budget: RetryBudget,
+        hedge_model: Optional[Model] = None,
+        hedge_delay: Optional[LatencyTracker] = None,
+    ):
+        self.agent = agent
+        self.max_retries = max_retries
+        self.retry_budget = retry_budget
+        self.hedge_model = hedge_model
+        self.latency = hedge_delay or LatencyTracker(default=3.0)
+
+    async def _attempt(self, prompt: str, model: Optional[Model]) -> AgentRunResult:
+        retries = self.retry_budget.reserve(self.max_retries)
+        if retries < self.max_retries:
+            metrics.inc("llm_retry_budget_exhausted_total")
+        usage = Usage()
+        try:
+            return await self.agent.run(
+                prompt,
+                model=model,
+                usage=usage,
+                usage_limits=UsageLimits(request_limit=1 + retries),
+            )
+        finally:
+            used = min(retries, max(0, usage.requests - 1))
+            metrics.inc("llm_retries_total", used)
+            self.retry_budget.refund(retries - used)
+            metrics.set("llm_retry_budget_tokens", self.retry_budget.tokens)
+
+    async def run(self, prompt: str, timeout: float) -> AgentRunResult:
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        deadline = start + timeout
+        hedge_at = start + self.latency.p95() if self.hedge_model else None
+
+        metrics.inc("llm_requests_total")
+        self.retry_budget.deposit()
+        primary = asyncio.ensure_future(self._attempt(prompt, None))
+        attempts: Dict[asyncio.Future, str] = {primary: "primary"}
+        pending = {primary}
+        error: Optional[BaseException] = None
+        try:
+            while pending:
+                now = loop.time()
+                if now >= deadline:
+                    metrics.inc("llm_timeouts_total")
+                    raise asyncio.TimeoutError()
+                wake = deadline if hedge_at is None else min(deadline, hedge_at)
+                done, pending = await asyncio.wait(
+                    pending, timeout=wake - now, return_when=asyncio.FIRST_COMPLETED
+                )
+                for attempt in done:
+                    if attempt.exception() is None:
+                        if attempts[attempt] == "primary":
+                            self.latency.record(loop.time() - start)
+                        else:
+                            metrics.inc("llm_hedge_wins_total")
+                        return attempt.result()
+                    error = attempt.exception()
+                if hedge_at is not None and pending and loop.time() >= hedge_at:
+                    metrics.inc("llm_hedges_total")
+                    hedge = asyncio.ensure_future(
+                        self._attempt(prompt, self.hedge_model)
+                    )
+                    attempts[hedge] = "hedge"
+                    pending.add(hedge)
+                    hedge_at = None
+            metrics.inc("llm_errors_total")
+            raise error
+        finally:
+            for attempt in attempts:
+                attempt.cancel()
@@ -1,11 +1,19 @@
 import os
+import asyncio
+import logging
+import time
 import httpx
 from dotenv import load_dotenv
 import uuid
-import random
 
-from fastapi import FastAPI, HTTPException
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Header, HTTPException, Query, Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
+from starlette.concurrency import run_in_threadpool
 from app.models import (
     DrinkRecipe,
     ErrorResponse,
@@ -15,15 +23,37 @@ from app.models import (
     Unit,
     IngredientsRequest,
     ChooseIngredient,
+    SimilarityMetric,
+    GenerationMode,
+    HealthStatus,
+    DrinkFacets,
+    ImportReport,
+    IngredientSuggestion,
 )
 
 from .drink_data import drink_db
-from .ingredient_data import ingredient_db
-from typing import List
+from .drink_store import VersionConflict
+from .ingredient_data import ingredient_db, ingredient_categories
+from .catalog_cache import CatalogCache
+from .drink_similarity import DrinkSimilarityIndex
+from .drink_facets import DrinkFacetIndex
+from .drink_sampler import DrinkSampler
+from .drink_import import DrinkImporter
+from .ingredient_autocomplete import IngredientAutocomplete
+from .ingredient_validation import IngredientValidator, IngredientValidationError
+from .drink_synthesizer import synthesize_drink
+from .llm_runner import GenerationRunner, LatencyTracker, RetryBudget
+from .metrics import metrics
+from .admission import AdmissionController, Overloaded
+from .idempotency import IdempotencyError, IdempotencyStore, fingerprint
+from .image_warmup import ImageWarmup
+from typing import List, Optional, Set, Tuple
 
 from pydantic_ai import Agent, RunContext
+from pydantic_ai.exceptions import AgentRunError, ModelHTTPError
 from pydantic_ai.models.groq import GroqModel
 from pydantic_ai.providers.groq import GroqProvider
+from groq import APIConnectionError, AsyncGroq
 
 # --- Load Environment variables ---
 load_dotenv()
@@ -32,9 +62,72 @@ GROQ_API_KEY = os.getenv("GROQ_API_KEY", "")
 PEXELS_SERVICE_URL = os.getenv(
     "PEXELS_SERVICE_URL", "http://pexels_service:9000/images"
 )
+# Seconds to wait for the LLM before serving a locally synthesized recipe
+LLM_LATENCY_BUDGET = float(os.getenv("LLM_LATENCY_BUDGET", "8"))
+# Hard limit in seconds for a whole /drinks/generate request
+GENERATION_DEADLINE = float(os.getenv("GENERATION_DEADLINE", "12"))
+# Retries per LLM call, further limited by the shared retry budget
+LLM_MAX_RETRIES = int(os.getenv("LLM_MAX_RETRIES", "1"))
+# Retry tokens earned per request, and trickled in per second when idle
+LLM_RETRY_BUDGET_RATIO = float(os.getenv("LLM_RETRY_BUDGET_RATIO", "0.1"))
+LLM_RETRY_BUDGET_PER_SECOND = float(os.getenv("LLM_RETRY_BUDGET_PER_SECOND", "0.2"))
+# Optional second Groq model raced against slow primary calls
+GROQ_HEDGE_MODEL = os.getenv("GROQ_HEDGE_MODEL", "")
+# Hedge delay used until enough latencies are seen to compute a p95
+LLM_HEDGE_DELAY = float(os.getenv("LLM_HEDGE_DELAY", "3"))
+# At most this many LLM generations run at once; up to the queue limit wait
+GENERATE_MAX_CONCURRENCY = int(os.getenv("GENERATE_MAX_CONCURRENCY", "4"))
+GENERATE_MAX_QUEUE = int(os.getenv("GENERATE_MAX_QUEUE", "16"))
+# Longest a generation may wait in the queue before giving up with 503
+GENERATE_QUEUE_TIMEOUT = float(os.getenv("GENERATE_QUEUE_TIMEOUT", "5"))
+# Per-client rate limit for LLM generations (token bucket)
+GENERATE_RATE_PER_MINUTE = float(os.getenv("GENERATE_RATE_PER_MINUTE", "10"))
+GENERATE_BURST = float(os.getenv("GENERATE_BURST", "3"))
+# Completed Idempotency-Key results are kept this long (seconds), up to a limit
+IDEMPOTENCY_TTL_SECONDS = float(os.getenv("IDEMPOTENCY_TTL_SECONDS", "86400"))
+IDEMPOTENCY_MAX_KEYS = int(os.getenv("IDEMPOTENCY_MAX_KEYS", "10000"))
+# How long a replay of POST /drinks waits for the original to finish
+IDEMPOTENCY_WAIT_SECONDS = float(os.getenv("IDEMPOTENCY_WAIT_SECONDS", "5"))
+# Optionally pre-fill the image search cache for seeded names at startup
+IMAGE_WARMUP_ENABLED = os.getenv("IMAGE_WARMUP_ENABLED", "false").lower() == "true"
+IMAGE_WARMUP_RATE = float(os.getenv("IMAGE_WARMUP_RATE", "0.5"))  # per second
+# Must match IMAGES_PER_PAGE in the frontend so the warmed pages get hit
+IMAGE_WARMUP_COUNT = int(os.getenv("IMAGE_WARMUP_COUNT", "4"))
+# NDJSON lines validated and stored together by POST /drinks/import
+DRINK_IMPORT_BATCH_SIZE = int(os.getenv("DRINK_IMPORT_BATCH_SIZE", "500"))
+# Line errors listed in an import report; the rest are only counted
+DRINK_IMPORT_MAX_ERRORS = int(os.getenv("DRINK_IMPORT_MAX_ERRORS", "100"))
+# Longest NDJSON line accepted by POST /drinks/import
+DRINK_IMPORT_MAX_LINE_BYTES = int(os.getenv("DRINK_IMPORT_MAX_LINE_BYTES", "65536"))
+# Responses smaller than this many bytes are sent uncompressed
+GZIP_MINIMUM_SIZE = int(os.getenv("GZIP_MINIMUM_SIZE", "1000"))
+# How long clients may reuse the ingredient catalog before revalidating
+CATALOG_MAX_AGE = int(os.getenv("CATALOG_MAX_AGE", "86400"))
+
+logger = logging.getLogger(__name__)
+
+# --- Background Image Cache Warm-up ---
+image_warmup = ImageWarmup(
+    PEXELS_SERVICE_URL,
+    [drink.name for drink in drink_db] + [item.name for item in ingredient_db],
+    count=IMAGE_WARMUP_COUNT,
+    requests_per_second=IMAGE_WARMUP_RATE,
+)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Started in the background so it never delays readiness
+    warmup_task = (
+        asyncio.create_task(image_warmup.run()) if IMAGE_WARMUP_ENABLED else None
+    )
+    yield
+    if warmup_task is not None:
+        warmup_task.cancel()
+
 
 # --- FastAPI App Initialization ---
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 
 # --- Middleware ---
 app.add_middleware(
@@ -45,12 +138,57 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag"],
+)
+app.add_middleware(GZipMiddleware, minimum_size=GZIP_MINIMUM_SIZE)
+
+
+# --- Validation Errors ---
+@app.exception_handler(RequestValidationError)
+async def validation_error_handler(request: Request, error: RequestValidationError):
+    # FastAPI's default body minus the rejected input, which would make the
+    # 422 for an oversized request just as large as the request itself
+    detail = [
+        {key: value for key, value in e.items() if key != "input"}
+        for e in error.errors()
+    ]
+    return JSONResponse(status_code=422, content={"detail": jsonable_encoder(detail)})
+
+
+# --- Precompressed Ingredient Catalog ---
+ingredient_catalog = CatalogCache(ingredient_db)
+ingredient_catalog.refresh()
+
+# --- Admission Control for LLM Generation ---
+generation_admission = AdmissionController(
+    max_concurrency=GENERATE_MAX_CONCURRENCY,
+    max_queue=GENERATE_MAX_QUEUE,
+    rate_per_second=GENERATE_RATE_PER_MINUTE / 60,
+    burst=GENERATE_BURST,
+)
+
+# --- Idempotency-Key Results ---
+idempotency_store = IdempotencyStore(
+    max_entries=IDEMPOTENCY_MAX_KEYS, ttl_seconds=IDEMPOTENCY_TTL_SECONDS
+)
+
+# --- Ingredient Pre-flight Validation ---
+ingredient_validator = IngredientValidator(ingredient_categories)
+
+# --- Drink Indexes ---
+similarity_index = drink_db.register(DrinkSimilarityIndex())
+facet_index = drink_db.register(DrinkFacetIndex())
+drink_sampler = drink_db.register(DrinkSampler())
+ingredient_autocomplete = drink_db.register(
+    IngredientAutocomplete(ingredient_db, ingredient_validator)
 )
 
 # --- AI Agent Setup ---
+# SDK-level retries are disabled so the shared retry budget is the only source
+groq_provider = GroqProvider(groq_client=AsyncGroq(api_key=GROQ_API_KEY, max_retries=0))
 llm_model = GroqModel(
     "llama-3.3-70b-versatile",
-    provider=GroqProvider(api_key=GROQ_API_KEY),
+    provider=groq_provider,
 )
 drink_type_values = [d.value for d in DrinkType]
 units_values = [u.value for u in Unit]
@@ -81,6 +219,23 @@ mixology_agent: Agent[None, DrinkAIResult] = Agent(
     ),
     output_type=DrinkAIResult,
     deps_type=None,
+    retries=LLM_MAX_RETRIES,
+)
+
+generation_runner = GenerationRunner(
+    mixology_agent,
+    max_retries=LLM_MAX_RETRIES,
+    retry_budget=RetryBudget(
+        ratio=LLM_RETRY_BUDGET_RATIO,
+        min_per_second=LLM_RETRY_BUDGET_PER_SECOND,
+        max_tokens=10,
+    ),
+    hedge_model=(
+        GroqModel(GROQ_HEDGE_MODEL, provider=groq_provider)
+        if GROQ_HEDGE_MODEL
+        else None
+    ),
+    hedge_delay=LatencyTracker(default=LLM_HEDGE_DELAY),
 )
 
 
@@ -101,79 +256,343 @@ async def validate_ai_output(
     return result
 
 
+async def search_first_image_id(name: str, timeout: float) -> Optional[int]:
+    if timeout <= 0:
+        return None
+    image_request = ImageSearchRequest(name=name, count=1, page=1)
+    try:
+        async with httpx.AsyncClient(timeout=timeout) as client:
+            image_response = await client.post(
+                PEXELS_SERVICE_URL, json=image_request.model_dump()
+            )
+    except httpx.HTTPError:
+        return None
+    if image_response.status_code != 200:
+        return None
+    ids = image_response.json()
+    return ids[0] if ids else None
+
+
+async def generate_drink(
+    request: IngredientsRequest, http_request: Request, mode: GenerationMode
+) -> Tuple[DrinkRecipe, str]:
+    deadline = time.monotonic() + GENERATION_DEADLINE
+
+    # Reject hopeless requests locally instead of paying for an LLM round-trip
+    try:
+        ingredients = ingredient_validator.validate(request.ingredients)
+    except IngredientValidationError as error:
+        raise HTTPException(status_code=422, detail=error.message)
+
+    if mode == GenerationMode.FAST:
+        new_drink = synthesize_drink(ingredients)
+        source = "fast"
+    else:
+        ingredient_str = ", ".join(name for name, _ in ingredients)
+        user_prompt = (
+            f"Create a drink using the following ingredients: {ingredient_str}."
+        )
+        client_id = http_request.client.host if http_request.client else "unknown"
+        try:
+            async with generation_admission.admit(
+                client_id,
+                timeout=min(GENERATE_QUEUE_TIMEOUT, deadline - time.monotonic()),
+            ):
+                ai_result = await generation_runner.run(
+                    user_prompt,
+                    timeout=min(LLM_LATENCY_BUDGET, deadline - time.monotonic()),
+                )
+        except Overloaded as overload:
+            raise HTTPException(
+                status_code=overload.status_code,
+                detail=overload.message,
+                headers={"Retry-After": str(overload.retry_after)},
+            )
+        except (
+            asyncio.TimeoutError,
+            AgentRunError,
+            APIConnectionError,
+            httpx.HTTPError,
+        ) as error:
+            # Only a slow or unavailable LLM falls back to the local synthesizer;
+            # a rejected API key or a bad request is a broken deployment
+            if isinstance(error, ModelHTTPError) and not (
+                error.status_code == 429 or error.status_code >= 500
+            ):
+                raise
+            logger.warning("LLM generation failed, using fallback: %r", error)
+            metrics.inc("llm_fallbacks_total")
+            ai_result = None
+
+        if ai_result is None:
+            new_drink = synthesize_drink(ingredients)
+            source = "fallback"
+        elif isinstance(ai_result.output, ErrorResponse):
+            raise HTTPException(status_code=422, detail=ai_result.output.message)
+        else:
+            new_drink = ai_result.output
+            source = "ai"
+
+    new_drink.imageId = await search_first_image_id(
+        new_drink.name, timeout=deadline - time.monotonic()
+    )
+    new_drink.id = uuid.uuid4()
+    drink_db.append(new_drink)
+    return new_drink, source
+
+
+def version_etag(version: int) -> str:
+    return f'"{version}"'
+
+
+def parse_if_match(header: Optional[str]) -> Optional[Set[int]]:
+    """Versions allowed by an If-Match header; None means any version."""
+    if header is None or header.strip() == "*":
+        return None
+    versions = set()
+    for tag in header.split(","):
+        tag = tag.strip().removeprefix("W/").strip('"')
+        if tag.isdigit():
+            versions.add(int(tag))
+    return versions
+
+
 # --- Routes ---
+@app.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+def get_metrics():
+    return metrics.render()
+
+
+@app.get("/health", response_model=HealthStatus)
+def get_health():
+    return HealthStatus(status="ok", imageWarmup=image_warmup.status)
+
+
 @app.get("/drinks", response_model=List[DrinkRecipe])
 def list_all_drinks():
     return drink_db
 
 
 @app.get("/drinks/ingredients", response_model=List[ChooseIngredient])
-def list_all_ingredients_info():
-    return ingredient_db
+def list_all_ingredients_info(request: Request):
+    etag, body, coding, known_etags = ingredient_catalog.get(
+        request.headers.get("accept-encoding", "")
+    )
+    headers = {
+        "ETag": etag,
+        "Cache-Control": f"public, max-age={CATALOG_MAX_AGE}",
+        "Vary": "Accept-Encoding",
+    }
+    if_none_match = request.headers.get("if-none-match", "")
+    if if_none_match.strip() == "*" or any(
+        tag.strip() in known_etags for tag in if_none_match.split(",")
+    ):
+        return Response(status_code=304, headers=headers)
+    if coding != "identity":
+        headers["Content-Encoding"] = coding
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+@app.get("/drinks/ingredients/autocomplete", response_model=List[IngredientSuggestion])
+def autocomplete_ingredients(
+    q: str = Query(..., min_length=1, max_length=100),
+    limit: int = Query(10, ge=1, le=50),
+):
+    return ingredient_autocomplete.suggest(q, limit)
+
+
+@app.get("/drinks/facets", response_model=DrinkFacets)
+def get_drink_facets(
+    drink_type: Optional[DrinkType] = Query(None, alias="type"),
+    alcohol_content: Optional[bool] = Query(None, alias="alcoholContent"),
+    is_favorite: Optional[bool] = Query(None, alias="isFavorite"),
+    top: int = Query(10, ge=0, le=100),
+):
+    return facet_index.facets(drink_type, alcohol_content, is_favorite, top)
 
 
 @app.post("/drinks/images", response_model=List[int])
 def fetch_drink_images(request: ImageSearchRequest):
-    response = httpx.post(PEXELS_SERVICE_URL, json=request.dict())
+    response = httpx.post(PEXELS_SERVICE_URL, json=request.model_dump())
     if response.status_code != 200:
+        retry_after = response.headers.get("retry-after")
         raise HTTPException(
             status_code=response.status_code,
             detail="Looks like our image search is a bit thirsty! No photo this time, but the recipe is still delicious.",
+            headers={"Retry-After": retry_after} if retry_after else None,
         )
     return response.json()
 
 
 @app.post("/drinks", response_model=DrinkRecipe)
-def add_new_drink(drink: DrinkRecipe):
-    drink.id = uuid.uuid4()
-    drink_db.append(drink)
-    return drink
+def add_new_drink(
+    drink: DrinkRecipe,
+    response: Response,
+    idempotency_key: Optional[str] = Header(None, max_length=255),
+):
+    def store_drink() -> DrinkRecipe:
+        drink.id = uuid.uuid4()
+        drink_db.append(drink)
+        return drink
+
+    if idempotency_key is None:
+        return store_drink()
+    try:
+        stored, replayed = idempotency_store.run(
+            "POST /drinks",
+            idempotency_key,
+            fingerprint(drink.model_dump_json(exclude={"id"})),
+            store_drink,
+            timeout=IDEMPOTENCY_WAIT_SECONDS,
+        )
+    except IdempotencyError as error:
+        raise HTTPException(status_code=error.status_code, detail=error.message)
+    if replayed:
+        response.headers["Idempotent-Replayed"] = "true"
+    return stored
+
+
+@app.post("/drinks/import", response_model=ImportReport)
+async def import_drinks(request: Request):
+    """Bulk-add drinks from an NDJSON body, one recipe per line."""
+    importer = DrinkImporter(
+        drink_db,
+        batch_size=DRINK_IMPORT_BATCH_SIZE,
+        max_errors=DRINK_IMPORT_MAX_ERRORS,
+        max_line_bytes=DRINK_IMPORT_MAX_LINE_BYTES,
+    )
+    async for chunk in request.stream():
+        # Validation is CPU-bound, keep it off the event loop
+        await run_in_threadpool(importer.feed, chunk)
+    return await run_in_threadpool(importer.finish)
 
 
-@app.patch("/drinks/{drink_id}/favorite", response_model=DrinkRecipe)
-def toggle_favorite_status(drink_id: uuid.UUID):
-    for drink in drink_db:
-        if drink.id == drink_id:
-            drink.isFavorite = not drink.isFavorite
-            return drink
-    raise HTTPException(
-        status_code=404,
-        detail="Hmm, we couldn’t find that drink. Maybe it got shaken, not stirred?",
-    )
+@app.get("/drinks/export")
+def export_drinks():
+    """Stream every drink as NDJSON without building the whole body."""
 
+    def lines():
+        for start in range(0, len(drink_db), 100):
+            chunk = drink_db[start : start + 100]
+            yield "".join(drink.model_dump_json() + "\n" for drink in chunk)
 
-@app.get("/drinks/random", response_model=DrinkRecipe)
-def get_random_drink():
-    return random.choice(drink_db)
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
 
 
-@app.post("/drinks/generate", response_model=DrinkRecipe)
-async def generate_drink_from_ingredients(request: IngredientsRequest):
-    ingredient_str = ", ".join(request.ingredients)
-    user_prompt = f"Create a drink using the following ingredients: {ingredient_str}."
+@app.patch("/drinks/{drink_id}/favorite", response_model=DrinkRecipe)
+def toggle_favorite_status(
+    drink_id: uuid.UUID,
+    response: Response,
+    if_match: Optional[str] = Header(None),
+):
+    try:
+        updated = drink_db.update(
+            drink_id,
+            lambda drink: {"isFavorite": not drink.isFavorite},
+            if_match=parse_if_match(if_match),
+        )
+    except VersionConflict as conflict:
+        raise HTTPException(
+            status_code=412,
+            detail="Someone else stirred this drink in the meantime. Grab the fresh one and try again!",
+            headers={"ETag": version_etag(conflict.current_version)},
+        )
+    if updated is None:
+        raise HTTPException(
+            status_code=404,
+            detail="Hmm, we couldn’t find that drink. Maybe it got shaken, not stirred?",
+        )
+    drink, version = updated
+    response.headers["ETag"] = version_etag(version)
+    return drink
+
+
+@app.get("/drinks/{drink_id}/similar", response_model=List[DrinkRecipe])
+def get_similar_drinks(
+    drink_id: uuid.UUID,
+    k: int = Query(5, ge=1, le=50),
+    metric: SimilarityMetric = SimilarityMetric.COSINE,
+):
+    similar = similarity_index.similar(drink_id, k, metric)
+    if similar is None:
+        raise HTTPException(
+            status_code=404,
+            detail="Hmm, we couldn’t find that drink. Maybe it got shaken, not stirred?",
+        )
+    return similar
 
-    ai_result = await mixology_agent.run(user_prompt)
 
-    if isinstance(ai_result.output, ErrorResponse):
-        raise HTTPException(status_code=422, detail=ai_result.output.message)
+@app.get("/drinks/random", response_model=DrinkRecipe)
+def get_random_drink(
+    drink_type: Optional[DrinkType] = Query(None, alias="type"),
+    alcohol_content: Optional[bool] = Query(None, alias="alcoholContent"),
+    is_favorite: Optional[bool] = Query(None, alias="isFavorite"),
+    ingredient: List[str] = Query([]),
+):
+    picked = drink_sampler.sample(
+        1, drink_type, alcohol_content, is_favorite, ingredient
+    )
+    if not picked:
+        raise HTTPException(
+            status_code=404,
+            detail="No drink matches that mix. Try loosening the filters!",
+        )
+    return picked[0]
+
+
+@app.get("/drinks/random/batch", response_model=List[DrinkRecipe])
+def get_random_drinks(
+    count: int = Query(5, ge=1, le=50),
+    drink_type: Optional[DrinkType] = Query(None, alias="type"),
+    alcohol_content: Optional[bool] = Query(None, alias="alcoholContent"),
+    is_favorite: Optional[bool] = Query(None, alias="isFavorite"),
+    ingredient: List[str] = Query([]),
+):
+    """Up to ``count`` distinct drinks, for a "surprise me" carousel."""
+    return drink_sampler.sample(
+        count, drink_type, alcohol_content, is_favorite, ingredient
+    )
 
-    new_drink = ai_result.output
 
-    imgRequest = ImageSearchRequest(name=new_drink.name, count=1, page=1)
-    async with httpx.AsyncClient() as client:
-        imgResponse = await client.post(PEXELS_SERVICE_URL, json=imgRequest.dict())
-        if imgResponse.status_code != 200:
-            new_drink.imageId = None
-        else:
-            ids = imgResponse.json()
-            new_drink.imageId = ids[0] if ids else None
+@app.get("/drinks/{drink_id}", response_model=DrinkRecipe)
+def get_drink(drink_id: uuid.UUID, response: Response):
+    found = drink_db.get(drink_id)
+    if found is None:
+        raise HTTPException(
+            status_code=404,
+            detail="Hmm, we couldn’t find that drink. Maybe it got shaken, not stirred?",
+        )
+    drink, version = found
+    response.headers["ETag"] = version_etag(version)
+    return drink
 
-    if imgResponse.status_code != 200:
-        new_drink.imageId = None
-    else:
-        new_drink.imageId = imgResponse.json()[0]
 
-    new_drink.id = uuid.uuid4()
-    drink_db.append(new_drink)
+@app.post("/drinks/generate", response_model=DrinkRecipe)
+async def generate_drink_from_ingredients(
+    request: IngredientsRequest,
+    http_request: Request,
+    response: Response,
+    mode: GenerationMode = GenerationMode.AI,
+    idempotency_key: Optional[str] = Header(None, max_length=255),
+):
+    async def generate() -> Tuple[DrinkRecipe, str]:
+        return await generate_drink(request, http_request, mode)
+
+    if idempotency_key is None:
+        new_drink, source = await generate()
+    else:
+        try:
+            (new_drink, source), replayed = await idempotency_store.run_async(
+                "POST /drinks/generate",
+                idempotency_key,
+                fingerprint(request.model_dump_json(), mode.value),
+                generate,
+                timeout=GENERATION_DEADLINE,
+            )
+        except IdempotencyError as error:
+            raise HTTPException(status_code=error.status_code, detail=error.message)
+        if replayed:
+            response.headers["Idempotent-Replayed"] = "true"
 
+    response.headers["X-Drink-Source"] = source
     return new_drink
@@ -0,0 +1,35 @@
+import threading
+from typing import Dict
+
+
+class Metrics:
+    """Process-wide counters and gauges rendered in Prometheus text format."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: Dict[str, float] = {}
+        self._gauges: Dict[str, float] = {}
+
+    def inc(self, name: str, amount: float = 1) -> None:
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + amount
+
+    def set(self, name: str, value: float) -> None:
+        with self._lock:
+            self._gauges[name] = value
+
+    def value(self, name: str) -> float:
+        with self._lock:
+            return self._counters.get(name, self._gauges.get(name, 0))
+
+    def render(self) -> str:
+        with self._lock:
+            lines = []
+            for kind, values in (("counter", self._counters), ("gauge", self._gauges)):
+                for name, value in sorted(values.items()):
+                    lines.append(f"# TYPE {name} {kind}")
+                    lines.append(f"{name} {value:g}")
+        return "\n".join(lines) + "\n"
+
+
+metrics = Metrics()
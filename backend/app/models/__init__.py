@@ -4,4 +4,10 @@ from .error_response import ErrorResponse
 from .image_search_request import ImageSearchRequest
 from .result_type import DrinkAIResult
 from .ingredients_request import IngredientsRequest
-from .choose_ingredient import ChooseIngredient
+from .choose_ingredient import ChooseIngredient, IngredientCategory
+from .similarity_metric import SimilarityMetric
+from .generation_mode import GenerationMode
+from .health_status import HealthStatus, WarmupState, WarmupStatus
+from .drink_facets import DrinkFacets, TypeFacet, BooleanFacet, IngredientFacet
+from .import_report import ImportReport, ImportLineError
+from .ingredient_suggestion import IngredientSuggestion
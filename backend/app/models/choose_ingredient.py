@@ -1,6 +1,18 @@
+from enum import Enum
 from pydantic import BaseModel
 
 
+class IngredientCategory(str, Enum):
+    SPIRIT = "Spirit"
+    FRUIT = "Fruit & Juice"
+    CREAMY = "Creamy Base"
+    COFFEE_TEA = "Coffee & Tea"
+    SWEETENER = "Sweetener & Syrup"
+    MIXER = "Soda & Mixer"
+    HERB_SPICE = "Herb & Spice"
+    GARNISH = "Garnish"
+
+
 class ChooseIngredient(BaseModel):
     name: str
     imageId: int
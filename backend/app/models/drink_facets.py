@@ -0,0 +1,27 @@
+from typing import List
+from pydantic import BaseModel
+
+from .drink_recipe import DrinkType
+
+
+class TypeFacet(BaseModel):
+    value: DrinkType
+    count: int
+
+
+class BooleanFacet(BaseModel):
+    value: bool
+    count: int
+
+
+class IngredientFacet(BaseModel):
+    name: str
+    count: int
+
+
+class DrinkFacets(BaseModel):
+    total: int
+    type: List[TypeFacet]
+    alcoholContent: List[BooleanFacet]
+    isFavorite: List[BooleanFacet]
+    ingredients: List[IngredientFacet]
@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class GenerationMode(str, Enum):
+    AI = "ai"  # LLM recipe, falling back to the local synthesizer when slow
+    FAST = "fast"  # local rule-based recipe only
@@ -0,0 +1,20 @@
+from enum import Enum
+from pydantic import BaseModel
+
+
+class WarmupState(str, Enum):
+    DISABLED = "disabled"
+    RUNNING = "running"
+    DONE = "done"
+
+
+class WarmupStatus(BaseModel):
+    state: WarmupState
+    total: int
+    completed: int
+    failed: int
+
+
+class HealthStatus(BaseModel):
+    status: str
+    imageWarmup: WarmupStatus
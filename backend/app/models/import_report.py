@@ -0,0 +1,14 @@
+from typing import List
+from pydantic import BaseModel
+
+
+class ImportLineError(BaseModel):
+    line: int
+    message: str
+
+
+class ImportReport(BaseModel):
+    imported: int
+    failed: int
+    errors: List[ImportLineError]
+    errorsTruncated: bool = False
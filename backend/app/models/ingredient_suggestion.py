@@ -0,0 +1,8 @@
+from typing import Optional
+from pydantic import BaseModel
+
+
+class IngredientSuggestion(BaseModel):
+    name: str
+    uses: int
+    imageId: Optional[int] = None
@@ -1,6 +1,6 @@
-from typing import List
-from pydantic import BaseModel
+from typing import Annotated, List
+from pydantic import BaseModel, Field
 
 
 class IngredientsRequest(BaseModel):
-    ingredients: List[str]
+    ingredients: List[Annotated[str, Field(max_length=100)]] = Field(..., max_length=64)
@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class SimilarityMetric(str, Enum):
+    COSINE = "cosine"
+    JACCARD = "jaccard"
@@ -1,12 +1,65 @@
+import asyncio
+import json
 import uuid
-from app.models import Ingredient, DrinkRecipe, DrinkType, Unit
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from pydantic_ai import Agent
+from pydantic_ai.exceptions import ModelHTTPError
+from pydantic_ai.messages import ModelResponse, TextPart
+from pydantic_ai.models.function import FunctionModel
+from app.models import Ingredient, DrinkRecipe, DrinkType, Unit, WarmupState
 from app.main import app
 from fastapi.testclient import TestClient
-from app.main import drink_db
+from app.main import drink_db, generation_runner
+from app.llm_runner import GenerationRunner, LatencyTracker, RetryBudget
+from app.metrics import metrics
+from app.admission import AdmissionController, Overloaded
+from app.image_warmup import ImageWarmup
+from app.drink_import import DrinkImporter
+from app.drink_store import DrinkStore
 
 client = TestClient(app)
 
 
+def make_drink(
+    name, ingredients, type=DrinkType.COCKTAIL, alcohol=True, favorite=False
+):
+    return DrinkRecipe(
+        id=uuid.uuid4(),
+        name=name,
+        ingredients=[
+            Ingredient(name=n, amount=10.0, unit=Unit.MILLILITER) for n in ingredients
+        ],
+        instructions=["Mix it up!"],
+        alcoholContent=alcohol,
+        type=type,
+        isFavorite=favorite,
+    )
+
+
+# @app.get("/health")
+def test_health_reports_image_warmup():
+    response = client.get("/health")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] == "ok"
+    assert data["imageWarmup"]["total"] > 0
+    assert data["imageWarmup"]["state"] in ["disabled", "running", "done"]
+
+
+def test_image_warmup_counts_failures_and_finishes():
+    warmup = ImageWarmup(
+        "http://127.0.0.1:9/images",
+        ["Mojito", "Mojito", "Lime"],
+        count=4,
+        requests_per_second=1000,
+    )
+    asyncio.run(warmup.run())
+    assert warmup.status.state == WarmupState.DONE
+    assert warmup.status.total == 2
+    assert warmup.status.failed == 2
+
+
 # @app.get("/drinks")
 def test_list_all_drinks_success():
     response = client.get("/drinks")
@@ -14,6 +67,143 @@ def test_list_all_drinks_success():
     assert isinstance(response.json(), list)
 
 
+# @app.get("/drinks/ingredients")
+def test_list_all_ingredients_success():
+    response = client.get("/drinks/ingredients", headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert "max-age" in response.headers["cache-control"]
+    data = response.json()
+    assert isinstance(data, list)
+    assert {"name", "imageId"} <= set(data[0])
+
+
+def test_list_all_ingredients_brotli():
+    gzipped = client.get("/drinks/ingredients", headers={"Accept-Encoding": "gzip"})
+    response = client.get(
+        "/drinks/ingredients", headers={"Accept-Encoding": "gzip, br"}
+    )
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "br"
+    assert response.headers["etag"] != gzipped.headers["etag"]
+    assert response.json() == gzipped.json()
+
+
+def test_list_all_ingredients_not_modified():
+    first = client.get("/drinks/ingredients")
+    etag = first.headers["etag"]
+
+    response = client.get("/drinks/ingredients", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+
+
+# @app.get("/drinks/ingredients/autocomplete")
+def test_autocomplete_ingredients_ranked_by_use():
+    original_drinks = drink_db.copy()
+
+    try:
+        drink_db.clear()
+        for names in [["White Rum", "Lime"], ["White Rum"], ["Rum", "Mint Leaves"]]:
+            drink_db.append(make_drink("Test Drink", names))
+
+        response = client.get("/drinks/ingredients/autocomplete", params={"q": "ru"})
+        assert response.status_code == 200
+        data = response.json()
+        # "White Rum" counts as a use of the catalog's "Rum"
+        assert data[0]["name"] == "Rum"
+        assert data[0]["uses"] == 3
+        assert data[0]["imageId"] is not None
+
+        response = client.get(
+            "/drinks/ingredients/autocomplete", params={"q": "mint l", "limit": 1}
+        )
+        assert [s["name"] for s in response.json()] == ["Mint"]
+
+    finally:
+        drink_db.clear()
+        drink_db.extend(original_drinks)
+
+
+def test_autocomplete_suggestions_are_accepted_by_generate():
+    original_drinks = drink_db.copy()
+
+    try:
+        drink_db.append(
+            make_drink("Test Drink", ["White Rum", "Egg White", "Glue Vodka"])
+        )
+
+        response = client.get("/drinks/ingredients/autocomplete", params={"q": "white"})
+        names = [s["name"] for s in response.json()]
+        assert names == ["Rum"]  # "Egg White" has no catalog entry to count under
+
+        response = client.post(
+            "/drinks/generate",
+            params={"mode": "fast"},
+            json={"ingredients": [names[0], "Lime"]},
+        )
+        assert response.status_code == 200
+        assert "Rum" in {i["name"] for i in response.json()["ingredients"]}
+
+        # Drink data never widens what /drinks/generate accepts
+        for name in ["Glue Vodka", "Glue Vodkaa"]:
+            response = client.post(
+                "/drinks/generate",
+                params={"mode": "fast"},
+                json={"ingredients": [name, "Lime"]},
+            )
+            assert response.status_code == 422
+
+    finally:
+        drink_db.clear()
+        drink_db.extend(original_drinks)
+
+
+# @app.get("/drinks/facets")
+def test_get_drink_facets_success():
+    original_drinks = drink_db.copy()
+
+    try:
+        drink_db.clear()
+
+        mojito = make_drink("Mojito", ["Rum", "Lime", "Mint"])
+        daiquiri = make_drink("Daiquiri", ["Rum", "Lime"])
+        virgin = make_drink(
+            "Virgin", ["lime", "Mint"], type=DrinkType.MOCKTAIL, alcohol=False
+        )
+        drink_db.extend([mojito, daiquiri, virgin])
+        client.patch(f"/drinks/{mojito.id}/favorite")
+
+        response = client.get("/drinks/facets", params={"top": 2})
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 3
+        assert data["type"] == [
+            {"value": "Cocktail", "count": 2},
+            {"value": "Mocktail", "count": 1},
+        ]
+        assert data["isFavorite"] == [
+            {"value": True, "count": 1},
+            {"value": False, "count": 2},
+        ]
+        assert data["ingredients"] == [
+            {"name": "Lime", "count": 3},
+            {"name": "Mint", "count": 2},
+        ]
+
+        # Other facets are narrowed by the filter, its own facet is not
+        response = client.get("/drinks/facets", params={"type": "Mocktail"})
+        data = response.json()
+        assert data["total"] == 1
+        assert len(data["type"]) == 2
+        assert data["alcoholContent"] == [{"value": False, "count": 1}]
+        assert {i["name"] for i in data["ingredients"]} == {"Lime", "Mint"}
+
+    finally:
+        drink_db.clear()
+        drink_db.extend(original_drinks)
+
+
 # @app.post("/drinks/images")
 def test_fetch_images_success():
     payload = {"name": "mojito", "count": 2, "page": 1}
@@ -49,6 +239,36 @@ def test_add_new_drink_success():
     assert uuid.UUID(data["id"])
 
 
+def test_add_new_drink_idempotent_replay():
+    original_drinks = drink_db.copy()
+
+    try:
+        new_drink = {
+            "name": "Retry Fizz",
+            "ingredients": [{"name": "Club Soda", "amount": 1, "unit": Unit.TOP_UP}],
+            "instructions": ["Pour and serve"],
+            "alcoholContent": False,
+            "type": DrinkType.MOCKTAIL,
+            "isFavorite": False,
+        }
+        headers = {"Idempotency-Key": str(uuid.uuid4())}
+
+        first = client.post("/drinks", json=new_drink, headers=headers)
+        replay = client.post("/drinks", json=new_drink, headers=headers)
+        assert first.status_code == replay.status_code == 200
+        assert replay.headers["idempotent-replayed"] == "true"
+        assert replay.json()["id"] == first.json()["id"]
+        assert sum(drink.name == "Retry Fizz" for drink in drink_db) == 1
+
+        new_drink["name"] = "Different Fizz"
+        reused = client.post("/drinks", json=new_drink, headers=headers)
+        assert reused.status_code == 422
+
+    finally:
+        drink_db.clear()
+        drink_db.extend(original_drinks)
+
+
 def test_add_new_drink_missing_fields_error():
     broken_drink = {
         "name": "",
@@ -68,6 +288,74 @@ def test_add_new_drink_missing_fields_error():
     assert any("List should have at least 1 item" in str(msg) for msg in data["detail"])
 
 
+# @app.post("/drinks/import")
+def test_import_drinks_reports_bad_lines():
+    original_drinks = drink_db.copy()
+
+    try:
+        drink_db.clear()
+        good = {
+            "name": "Imported Mojito",
+            "ingredients": [{"name": "Rum", "amount": 50.0, "unit": "ml"}],
+            "instructions": ["Shake it well!"],
+            "alcoholContent": True,
+            "type": "Cocktail",
+            "isFavorite": False,
+        }
+        body = "\n".join(
+            [
+                json.dumps(good),
+                "",
+                json.dumps({**good, "name": "X"}),
+                "not json",
+                json.dumps({**good, "name": "Another One"}),
+            ]
+        )
+
+        response = client.post(
+            "/drinks/import",
+            content=body.encode(),
+            headers={"Content-Type": "application/x-ndjson"},
+        )
+        assert response.status_code == 200
+        report = response.json()
+        assert report["imported"] == 2
+        assert report["failed"] == 2
+        assert [error["line"] for error in report["errors"]] == [3, 4]
+        assert "name" in report["errors"][0]["message"]
+        assert [drink.name for drink in drink_db] == ["Imported Mojito", "Another One"]
+
+        # @app.get("/drinks/export")
+        response = client.get("/drinks/export")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        exported = [json.loads(line) for line in response.text.splitlines()]
+        assert [drink["id"] for drink in exported] == [
+            str(drink.id) for drink in drink_db
+        ]
+
+    finally:
+        drink_db.clear()
+        drink_db.extend(original_drinks)
+
+
+def test_import_drinks_joins_split_lines_and_drops_long_ones():
+    store = DrinkStore()
+    importer = DrinkImporter(store, batch_size=10, max_errors=10, max_line_bytes=500)
+    line = make_drink("Split Sour", ["Lime"]).model_dump_json().encode()
+    body = line + b"\n" + b'{"name": "' + b"x" * 2000 + b'"}\n' + line
+
+    for start in range(0, len(body), 7):
+        importer.feed(body[start : start + 7])
+    report = importer.finish()
+
+    assert report.imported == 2
+    assert [(e.line, e.message) for e in report.errors] == [
+        (2, "Line is longer than 500 bytes")
+    ]
+    assert [drink.name for drink in store] == ["Split Sour", "Split Sour"]
+
+
 # @app.patch("/drinks/{drink_id}/favorite")
 def test_toggle_favorite_status_success():
     original_drinks = drink_db.copy()
@@ -110,6 +398,100 @@ def test_toggle_favorite_error():
     assert "couldn’t find that drink" in response.text
 
 
+def test_toggle_favorite_if_match():
+    original_drinks = drink_db.copy()
+
+    try:
+        drink = make_drink("Test Drink", ["Rum"])
+        drink_db.append(drink)
+
+        # @app.get("/drinks/{drink_id}")
+        response = client.get(f"/drinks/{drink.id}")
+        assert response.status_code == 200
+        etag = response.headers["etag"]
+
+        response = client.patch(
+            f"/drinks/{drink.id}/favorite", headers={"If-Match": etag}
+        )
+        assert response.status_code == 200
+        assert response.json()["isFavorite"] is True
+        assert response.headers["etag"] != etag
+
+        # A second client still holding the old version loses
+        response = client.patch(
+            f"/drinks/{drink.id}/favorite", headers={"If-Match": etag}
+        )
+        assert response.status_code == 412
+        assert client.get(f"/drinks/{drink.id}").json()["isFavorite"] is True
+
+    finally:
+        drink_db.clear()
+        drink_db.extend(original_drinks)
+
+
+def test_concurrent_favorite_toggles_are_not_lost():
+    original_drinks = drink_db.copy()
+
+    try:
+        drink_db.clear()
+        drinks = [
+            make_drink(f"Drink {i}", ["Rum"], type=DrinkType.SHOT) for i in range(4)
+        ]
+        drink_db.extend(drinks)
+
+        def toggle(drink_id):
+            drink_db.update(drink_id, lambda d: {"isFavorite": not d.isFavorite})
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            for _ in range(301):
+                for drink in drinks:
+                    pool.submit(toggle, drink.id)
+
+        for drink in drinks:
+            current, version = drink_db.get(drink.id)
+            assert version == 302
+            assert current.isFavorite is True
+        favorite_facet = client.get("/drinks/facets").json()["isFavorite"]
+        assert favorite_facet == [{"value": True, "count": 4}]
+
+    finally:
+        drink_db.clear()
+        drink_db.extend(original_drinks)
+
+
+# @app.get("/drinks/{drink_id}/similar")
+def test_get_similar_drinks_success():
+    original_drinks = drink_db.copy()
+
+    try:
+        drink_db.clear()
+
+        target = make_drink("Target", ["Lime", "Mint", "Club Soda"])
+        close = make_drink("Close", ["Lime", "Mint", "Sugar"])
+        far = make_drink("Far", ["Lime", "Milk", "Honey", "Banana"])
+        unrelated = make_drink("Unrelated", ["Espresso"])
+        drink_db.extend([target, far, unrelated, close])
+
+        response = client.get(f"/drinks/{target.id}/similar", params={"k": 5})
+        assert response.status_code == 200
+        names = [drink["name"] for drink in response.json()]
+        assert names == ["Close", "Far"]
+
+        response = client.get(
+            f"/drinks/{target.id}/similar", params={"k": 1, "metric": "jaccard"}
+        )
+        assert [drink["name"] for drink in response.json()] == ["Close"]
+
+    finally:
+        drink_db.clear()
+        drink_db.extend(original_drinks)
+
+
+def test_get_similar_drinks_error():
+    response = client.get(f"/drinks/{uuid.uuid4()}/similar")
+    assert response.status_code == 404
+
+
 # @app.get("/drinks/random")
 def test_get_random_drink_success():
     original_drinks = drink_db.copy()
@@ -145,7 +527,320 @@ def test_get_random_drink_success():
         drink_db.extend(original_drinks)
 
 
+def test_get_random_drink_filtered():
+    original_drinks = drink_db.copy()
+
+    try:
+        drink_db.clear()
+
+        drink_db.extend(make_drink(f"Cocktail {i}", ["Rum", "Lime"]) for i in range(20))
+        shake = make_drink(
+            "Shake", ["Milk", "Banana"], type=DrinkType.MILKSHAKE, alcohol=False
+        )
+        drink_db.append(shake)
+
+        for _ in range(5):
+            response = client.get("/drinks/random", params={"ingredient": "banana"})
+            assert response.json()["name"] == "Shake"
+
+        client.patch(f"/drinks/{drink_db[3].id}/favorite")
+        response = client.get(
+            "/drinks/random", params={"type": "Cocktail", "isFavorite": True}
+        )
+        assert response.json()["name"] == "Cocktail 3"
+
+        response = client.get(
+            "/drinks/random", params={"type": "Milkshake", "ingredient": "Rum"}
+        )
+        assert response.status_code == 404
+
+        response = client.get(
+            "/drinks/random/batch", params={"count": 10, "alcoholContent": True}
+        )
+        names = [drink["name"] for drink in response.json()]
+        assert len(names) == len(set(names)) == 10
+        assert "Shake" not in names
+
+        response = client.get(
+            "/drinks/random/batch", params={"count": 50, "type": "Milkshake"}
+        )
+        assert [drink["name"] for drink in response.json()] == ["Shake"]
+
+    finally:
+        drink_db.clear()
+        drink_db.extend(original_drinks)
+
+
+def test_get_random_drink_finds_rare_match_among_many():
+    original_drinks = drink_db.copy()
+
+    try:
+        drink_db.clear()
+        drink_db.extend(make_drink(f"Cocktail {i}", ["Rum"]) for i in range(1000))
+        drink_db.extend(
+            make_drink(f"Shot {i}", ["Mint"], type=DrinkType.SHOT) for i in range(2000)
+        )
+        drink_db.extend(make_drink(f"Lime {i}", ["Lime"]) for i in range(2000))
+        drink_db.append(make_drink("Mojito", ["Rum", "Mint", "Lime"]))
+
+        for params in [
+            {"type": "Cocktail", "ingredient": "Mint"},
+            {"type": "Cocktail", "ingredient": ["Mint", "Lime"]},
+            {"ingredient": ["Rum", "Lime", "Mint"]},
+        ]:
+            for _ in range(5):
+                response = client.get("/drinks/random", params=params)
+                assert response.status_code == 200
+                assert response.json()["name"] == "Mojito"
+
+        response = client.get(
+            "/drinks/random/batch",
+            params={"count": 50, "alcoholContent": True, "ingredient": "Mint"},
+        )
+        assert len(response.json()) == 50
+
+    finally:
+        drink_db.clear()
+        drink_db.extend(original_drinks)
+
+
 # @app.post("/drinks/generate")
 def test_generate_drink_from_ingredients_error():
     response = client.post("/drinks/generate", json=["glue", "paper"])
     assert response.status_code in [200, 422]
+
+
+def test_generate_drink_rejects_garnish_only():
+    response = client.post(
+        "/drinks/generate", json={"ingredients": ["Ice Cubes", "Sprinkles"]}
+    )
+    assert response.status_code == 422
+    assert "garnish" in response.json()["detail"]
+
+
+def test_generate_drink_rejects_unknown_ingredients():
+    response = client.post("/drinks/generate", json={"ingredients": ["Vodka", "glue"]})
+    assert response.status_code == 422
+    assert "glue" in response.json()["detail"]
+
+    junk = [f"junk {i}" for i in range(10)]
+    response = client.post("/drinks/generate", json={"ingredients": ["Vodka"] + junk})
+    assert response.status_code == 422
+    detail = response.json()["detail"]
+    assert "“junk 2”" in detail and "junk 3" not in detail
+    assert "and 7 more" in detail
+
+
+def test_generate_drink_rejects_oversized_requests():
+    for ingredients in [["Vodka"] * 65, ["Vodka", "x" * 101], ["junk"] * 20000]:
+        response = client.post("/drinks/generate", json={"ingredients": ingredients})
+        assert response.status_code == 422
+        assert len(response.content) < 1000  # the rejected input isn't echoed
+
+
+def test_generate_drink_rejects_empty_ingredients():
+    response = client.post("/drinks/generate", json={"ingredients": []})
+    assert response.status_code == 422
+
+
+def test_generate_drink_fast_mode_success():
+    original_drinks = drink_db.copy()
+
+    try:
+        response = client.post(
+            "/drinks/generate",
+            params={"mode": "fast"},
+            json={"ingredients": ["rum", "lime", "Mint", "Club Soda"]},
+        )
+        assert response.status_code == 200
+        assert response.headers["x-drink-source"] == "fast"
+
+        drink = DrinkRecipe(**response.json())
+        assert drink.alcoholContent is True
+        assert drink.type == DrinkType.COCKTAIL
+        assert {i.name for i in drink.ingredients} == {
+            "Rum",
+            "Lime",
+            "Mint",
+            "Club Soda",
+        }
+        assert drink in drink_db
+
+    finally:
+        drink_db.clear()
+        drink_db.extend(original_drinks)
+
+
+def test_generate_drink_falls_back_only_when_llm_unavailable(monkeypatch):
+    original_drinks = drink_db.copy()
+
+    def failing(error):
+        async def run(prompt, timeout):
+            raise error
+
+        return run
+
+    monkeypatch.setattr(
+        "app.main.generation_admission",
+        AdmissionController(
+            max_concurrency=4, max_queue=4, rate_per_second=100, burst=100
+        ),
+    )
+    try:
+        for error in [
+            asyncio.TimeoutError(),
+            ModelHTTPError(status_code=503, model_name="llama"),
+        ]:
+            monkeypatch.setattr(generation_runner, "run", failing(error))
+            response = client.post(
+                "/drinks/generate", json={"ingredients": ["Rum", "Lime"]}
+            )
+            assert response.status_code == 200
+            assert response.headers["x-drink-source"] == "fallback"
+
+        # A rejected API key or a plain bug must not pass for a healthy reply
+        for error in [
+            ModelHTTPError(status_code=401, model_name="llama"),
+            KeyError("oops"),
+        ]:
+            monkeypatch.setattr(generation_runner, "run", failing(error))
+            with pytest.raises(type(error)):
+                client.post("/drinks/generate", json={"ingredients": ["Rum", "Lime"]})
+
+    finally:
+        drink_db.clear()
+        drink_db.extend(original_drinks)
+
+
+def test_generation_runner_hedge_wins_over_slow_primary():
+    async def slow_model(messages, info):
+        await asyncio.sleep(5)
+        return ModelResponse(parts=[TextPart("primary")])
+
+    async def fast_model(messages, info):
+        return ModelResponse(parts=[TextPart("hedge")])
+
+    runner = GenerationRunner(
+        Agent(FunctionModel(slow_model)),
+        max_retries=1,
+        retry_budget=RetryBudget(ratio=0.1, min_per_second=0, max_tokens=1),
+        hedge_model=FunctionModel(fast_model),
+        hedge_delay=LatencyTracker(default=0.05),
+    )
+    hedge_wins = metrics.value("llm_hedge_wins_total")
+
+    result = asyncio.run(runner.run("make a drink", timeout=2))
+    assert result.output == "hedge"
+    assert metrics.value("llm_hedge_wins_total") == hedge_wins + 1
+
+
+def test_generation_runner_times_out():
+    async def slow_model(messages, info):
+        await asyncio.sleep(5)
+        return ModelResponse(parts=[TextPart("primary")])
+
+    runner = GenerationRunner(
+        Agent(FunctionModel(slow_model)),
+        max_retries=1,
+        retry_budget=RetryBudget(ratio=0.1, min_per_second=0, max_tokens=1),
+    )
+    timeouts = metrics.value("llm_timeouts_total")
+
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(runner.run("make a drink", timeout=0.05))
+    assert metrics.value("llm_timeouts_total") == timeouts + 1
+
+
+def test_admission_rejects_when_queue_is_full():
+    controller = AdmissionController(
+        max_concurrency=1, max_queue=1, rate_per_second=100, burst=100
+    )
+
+    async def scenario():
+        release = asyncio.Event()
+
+        async def job(client_id):
+            async with controller.admit(client_id, timeout=1):
+                await release.wait()
+
+        running = asyncio.ensure_future(job("a"))
+        queued = asyncio.ensure_future(job("b"))
+        await asyncio.sleep(0)
+        with pytest.raises(Overloaded) as rejected:
+            await job("c")
+        release.set()
+        await asyncio.gather(running, queued)
+        return rejected.value
+
+    rejected = asyncio.run(scenario())
+    assert rejected.status_code == 503
+    assert rejected.retry_after >= 1
+    assert controller.active == 0 and controller.waiting == 0
+
+
+def test_admission_serves_clients_round_robin():
+    controller = AdmissionController(
+        max_concurrency=1, max_queue=10, rate_per_second=100, burst=100
+    )
+    order = []
+
+    async def scenario():
+        gate = asyncio.Event()
+
+        async def job(client_id):
+            async with controller.admit(client_id, timeout=1):
+                order.append(client_id)
+                await gate.wait()
+
+        first = asyncio.ensure_future(job("busy"))
+        await asyncio.sleep(0)
+        others = [asyncio.ensure_future(job(c)) for c in ["busy", "busy", "quiet"]]
+        await asyncio.sleep(0)
+        gate.set()
+        await asyncio.gather(first, *others)
+
+    asyncio.run(scenario())
+    assert order == ["busy", "busy", "quiet", "busy"]
+
+
+def test_admission_rate_limits_per_client():
+    controller = AdmissionController(
+        max_concurrency=5, max_queue=5, rate_per_second=0.01, burst=1
+    )
+
+    async def scenario():
+        async with controller.admit("a", timeout=1):
+            pass
+        async with controller.admit("b", timeout=1):
+            pass
+        with pytest.raises(Overloaded) as rejected:
+            async with controller.admit("a", timeout=1):
+                pass
+        return rejected.value
+
+    rejected = asyncio.run(scenario())
+    assert rejected.status_code == 429
+    assert rejected.retry_after > 1
+
+
+def test_generate_drink_idempotent_replay():
+    original_drinks = drink_db.copy()
+
+    try:
+        headers = {"Idempotency-Key": str(uuid.uuid4())}
+        payload = {"ingredients": ["Gin", "Tonic", "Lime"]}
+
+        first = client.post(
+            "/drinks/generate", params={"mode": "fast"}, json=payload, headers=headers
+        )
+        replay = client.post(
+            "/drinks/generate", params={"mode": "fast"}, json=payload, headers=headers
+        )
+        assert first.status_code == replay.status_code == 200
+        assert replay.json() == first.json()
+        assert replay.headers["idempotent-replayed"] == "true"
+        assert len(drink_db) == len(original_drinks) + 1
+
+    finally:
+        drink_db.clear()
+        drink_db.extend(original_drinks)
@@ -0,0 +1,90 @@
+import time
+from collections import deque
+from enum import Enum
+
+
+class BreakerState(int, Enum):
+    CLOSED = 0
+    OPEN = 1
+    HALF_OPEN = 2
+
+
+class CircuitBreaker:
+    """Stops calling an unhealthy upstream for a while.
+
+    The outcome of the last ``window`` calls is kept; a call counts as a
+    failure when it errors or takes longer than ``slow_call_seconds``. Once
+    at least ``min_calls`` are recorded and the failure ratio reaches
+    ``failure_ratio`` the breaker opens for ``open_seconds``. After that a
+    single probe is let through (half-open): success closes the breaker,
+    failure opens it again.
+    """
+
+    def __init__(
+        self,
+        failure_ratio: float = 0.5,
+        slow_call_seconds: float = 2.0,
+        window: int = 20,
+        min_calls: int = 5,
+        open_seconds: float = 30.0,
+    ):
+        self.failure_ratio = failure_ratio
+        self.slow_call_seconds = slow_call_seconds
+        self.min_calls = min_calls
+        self.open_seconds = open_seconds
+        self.state = BreakerState.CLOSED
+        self.trips = 0
+        self._outcomes: deque = deque(maxlen=window)
+        self._open_until = 0.0
+        self._probe_in_flight = False
+
+    def allow_request(self) -> bool:
+        if self.state == BreakerState.OPEN:
+            if time.monotonic() < self._open_until:
+                return False
+            self.state = BreakerState.HALF_OPEN
+        if self.state == BreakerState.HALF_OPEN:
+            if self._probe_in_flight:
+                return False
+            self._probe_in_flight = True
+        return True
+
+    def retry_after(self) -> int:
+        """Seconds until the next probe may be attempted."""
+        return max(1, int(self._open_until - time.monotonic() + 0.999))
+
+    def record_success(self, latency: float) -> None:
+        if latency > self.slow_call_seconds:
+            self.record_failure()
+            return
+        if self.state == BreakerState.HALF_OPEN:
+            self._close()
+        else:
+            self._outcomes.append(False)
+
+    def record_failure(self) -> None:
+        if self.state == BreakerState.HALF_OPEN:
+            self.trip(self.open_seconds)
+            return
+        self._outcomes.append(True)
+        if (
+            len(self._outcomes) >= self.min_calls
+            and sum(self._outcomes) / len(self._outcomes) >= self.failure_ratio
+        ):
+            self.trip(self.open_seconds)
+
+    def release_probe(self) -> None:
+        """Give back a half-open probe slot that ended up unused."""
+        self._probe_in_flight = False
+
+    def trip(self, seconds: float) -> None:
+        self.state = BreakerState.OPEN
+        self._open_until = max(self._open_until, time.monotonic() + seconds)
+        self._probe_in_flight = False
+        self._outcomes.clear()
+        self.trips += 1
+
+    def _close(self) -> None:
+        self.state = BreakerState.CLOSED
+        self._probe_in_flight = False
+        self._outcomes.clear()
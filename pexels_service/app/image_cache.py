@@ -0,0 +1,34 @@
+import time
+from collections import OrderedDict
+from typing import List, NamedTuple, Optional, Tuple
+
+SearchKey = Tuple[str, int, int]  # (query, per_page, page)
+
+
+class CachedImages(NamedTuple):
+    ids: List[int]
+    stored_at: float
+
+
+def search_key(query: str, per_page: int, page: int) -> SearchKey:
+    return " ".join(query.lower().split()), per_page, page
+
+
+class ImageCache:
+    """Bounded LRU of the last good upstream answer for each search."""
+
+    def __init__(self, max_entries: int = 1000):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[SearchKey, CachedImages]" = OrderedDict()
+
+    def get(self, key: SearchKey) -> Optional[CachedImages]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key: SearchKey, ids: List[int]) -> None:
+        self._entries[key] = CachedImages(ids, time.monotonic())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
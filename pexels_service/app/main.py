@@ -1,24 +1,219 @@
 import os
-from fastapi import FastAPI, HTTPException
+import asyncio
+import time
+from typing import Optional, Tuple
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, HTTPException, Response
+from fastapi.responses import PlainTextResponse
 import httpx
 from dotenv import load_dotenv
 from app.models import ImageSearchRequest
-
+from app.circuit_breaker import CircuitBreaker
+from app.image_cache import ImageCache, SearchKey, search_key
+from app.metrics import metrics
+from app.prefetcher import Prefetcher
+from app.rate_pacer import RatePacer, rate_limited_for
 
 load_dotenv()
 PEXELS_API_KEY = os.getenv("PEXELS_API_KEY", "")
 PEXELS_BASE_URL = "https://api.pexels.com/v1/search"
+# Upstream calls slower than this (seconds) count as failures for the breaker
+PEXELS_SLOW_CALL_SECONDS = float(os.getenv("PEXELS_SLOW_CALL_SECONDS", "2"))
+PEXELS_TIMEOUT_SECONDS = float(os.getenv("PEXELS_TIMEOUT_SECONDS", "5"))
+# Failure ratio over the recent window that opens the breaker
+PEXELS_BREAKER_FAILURE_RATIO = float(os.getenv("PEXELS_BREAKER_FAILURE_RATIO", "0.5"))
+PEXELS_BREAKER_OPEN_SECONDS = float(os.getenv("PEXELS_BREAKER_OPEN_SECONDS", "30"))
+# Start spacing requests out once this few remain in the Pexels quota
+PEXELS_QUOTA_LOW_WATERMARK = int(os.getenv("PEXELS_QUOTA_LOW_WATERMARK", "100"))
+# Longest we hold a request waiting for a paced slot before serving stale
+PEXELS_MAX_PACING_WAIT = float(os.getenv("PEXELS_MAX_PACING_WAIT", "1"))
+IMAGE_CACHE_SIZE = int(os.getenv("IMAGE_CACHE_SIZE", "1000"))
+# Cached results younger than this (seconds) are served without asking Pexels
+IMAGE_CACHE_TTL = float(os.getenv("IMAGE_CACHE_TTL", "3600"))
+
+# Pexels accepts at most this many results per page
+PEXELS_MAX_PER_PAGE = 80
+# Client pages fetched per upstream call; later pages are sliced from the cache
+UPSTREAM_PAGES_PER_FETCH = int(os.getenv("UPSTREAM_PAGES_PER_FETCH", "4"))
+# Background fetches of the next upstream page that may run at once
+PREFETCH_MAX_INFLIGHT = int(os.getenv("PREFETCH_MAX_INFLIGHT", "2"))
+# Last client page worth prefetching for (ImageSelectModal's MAX_PAGE)
+PREFETCH_MAX_PAGE = int(os.getenv("PREFETCH_MAX_PAGE", "4"))
+
+breaker = CircuitBreaker(
+    failure_ratio=PEXELS_BREAKER_FAILURE_RATIO,
+    slow_call_seconds=PEXELS_SLOW_CALL_SECONDS,
+    open_seconds=PEXELS_BREAKER_OPEN_SECONDS,
+)
+pacer = RatePacer(low_watermark=PEXELS_QUOTA_LOW_WATERMARK)
+image_cache = ImageCache(max_entries=IMAGE_CACHE_SIZE)
+prefetcher = Prefetcher(max_inflight=PREFETCH_MAX_INFLIGHT)
+http_client: httpx.AsyncClient
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    global http_client
+    async with httpx.AsyncClient(timeout=PEXELS_TIMEOUT_SECONDS) as client:
+        http_client = client
+        yield
+        prefetcher.cancel_all()
+
+
+app = FastAPI(lifespan=lifespan)
+
+
+class UpstreamUnavailable(Exception):
+    def __init__(self, retry_after: int):
+        super().__init__(f"Pexels unavailable, retry after {retry_after}s")
+        self.retry_after = retry_after
+
+
+def upstream_block(count: int, page: int) -> Tuple[int, int, int]:
+    """Map a client page onto a larger upstream page.
+
+    Returns (upstream per_page, upstream page, offset of the client page in it).
+    Pexels pages are plain offsets, so client page ``p`` of size ``count`` is
+    a slice of upstream page ``(p - 1) // pages_per_block + 1``.
+    """
+    pages_per_block = max(
+        1, min(UPSTREAM_PAGES_PER_FETCH, PEXELS_MAX_PER_PAGE // count)
+    )
+    per_page = count * pages_per_block
+    block_page = (page - 1) // pages_per_block + 1
+    offset = (page - 1) % pages_per_block * count
+    return per_page, block_page, offset
+
+
+def fresh_cached(key: SearchKey) -> Optional[list[int]]:
+    cached = image_cache.get(key)
+    if cached is not None and time.monotonic() - cached.stored_at < IMAGE_CACHE_TTL:
+        return cached.ids
+    return None
 
-app = FastAPI()
+
+def serve_stale(key: SearchKey, retry_after: int) -> list[int]:
+    """Answer from the last good result, or fail fast when there is none."""
+    cached = image_cache.get(key)
+    if cached is None:
+        metrics.inc("pexels_unavailable_total")
+        raise HTTPException(
+            status_code=503,
+            detail="Pexels API unavailable",
+            headers={"Retry-After": str(retry_after)},
+        )
+    metrics.inc("pexels_stale_served_total")
+    return cached.ids
+
+
+def update_breaker_metrics() -> None:
+    metrics.set("pexels_breaker_state", breaker.state.value)
+    metrics.set("pexels_breaker_trips", breaker.trips)
+    if pacer.remaining is not None:
+        metrics.set("pexels_ratelimit_remaining", pacer.remaining)
+
+
+async def fetch_block(
+    query: str, per_page: int, page: int, max_wait: float
+) -> list[int]:
+    """Fetch one upstream page through the pacer and breaker and cache it."""
+    try:
+        if not await pacer.acquire(max_wait=max_wait):
+            metrics.inc("pexels_paced_total")
+            raise UpstreamUnavailable(retry_after=pacer.retry_after())
+        if not breaker.allow_request():
+            raise UpstreamUnavailable(retry_after=breaker.retry_after())
+
+        headers = {"Authorization": PEXELS_API_KEY}
+        params = {"query": query, "per_page": per_page, "page": page}
+        metrics.inc("pexels_requests_total")
+        started = time.monotonic()
+        try:
+            upstream = await http_client.get(
+                PEXELS_BASE_URL, headers=headers, params=params
+            )
+        except httpx.HTTPError:
+            metrics.inc("pexels_upstream_errors_total")
+            breaker.record_failure()
+            raise UpstreamUnavailable(retry_after=breaker.retry_after())
+        except BaseException:
+            # Cancelled (a stopped prefetch, a client hanging up) with no
+            # outcome to record: don't leave a half-open probe slot taken
+            breaker.release_probe()
+            raise
+        pacer.update(upstream.headers)
+
+        if upstream.status_code == 429:
+            metrics.inc("pexels_rate_limited_total")
+            # Stay away for as long as Pexels asks, e.g. until the quota resets
+            breaker.trip(
+                rate_limited_for(upstream.headers, default=PEXELS_BREAKER_OPEN_SECONDS)
+            )
+            raise UpstreamUnavailable(retry_after=breaker.retry_after())
+        if upstream.status_code >= 500:
+            metrics.inc("pexels_upstream_errors_total")
+            breaker.record_failure()
+            raise UpstreamUnavailable(retry_after=breaker.retry_after())
+        if upstream.status_code != 200:
+            # Client-side problem (bad key, bad query): not an upstream outage
+            breaker.release_probe()
+            raise HTTPException(
+                status_code=upstream.status_code, detail="Pexels API error"
+            )
+
+        breaker.record_success(time.monotonic() - started)
+        photos = upstream.json().get("photos", [])
+        ids = [photo["id"] for photo in photos]
+        image_cache.put(search_key(query, per_page, page), ids)
+        return ids
+    finally:
+        update_breaker_metrics()
+
+
+def prefetch_next_block(query: str, count: int, page: int, block: SearchKey) -> None:
+    if page + 1 > PREFETCH_MAX_PAGE:
+        return  # Nobody pages that far: don't spend quota on it
+    per_page, next_block_page, _ = upstream_block(count, page + 1)
+    next_block = search_key(query, per_page, next_block_page)
+    if next_block == block or fresh_cached(next_block) is not None:
+        return
+    # No waiting for a paced slot: a prefetch only uses spare quota
+    prefetcher.schedule(
+        next_block, lambda: fetch_block(query, per_page, next_block_page, max_wait=0)
+    )
 
 
 @app.post("/images", response_model=list[int])
-async def fetch_images(request: ImageSearchRequest):
-    headers = {"Authorization": PEXELS_API_KEY}
-    params = {"query": request.name, "per_page": request.count, "page": request.page}
-    async with httpx.AsyncClient() as client:
-        response = await client.get(PEXELS_BASE_URL, headers=headers, params=params)
-    if response.status_code != 200:
-        raise HTTPException(status_code=response.status_code, detail="Pexels API error")
-    photos = response.json().get("photos", [])
-    return [photo["id"] for photo in photos]
+async def fetch_images(request: ImageSearchRequest, response: Response):
+    per_page, block_page, offset = upstream_block(request.count, request.page)
+    block = search_key(request.name, per_page, block_page)
+    sequential = prefetcher.observe((block[0], request.count), request.page)
+
+    ids = fresh_cached(block)
+    if ids is not None:
+        metrics.inc("pexels_cache_hits_total")
+        response.headers["X-Cache"] = "hit"
+    else:
+        inflight = prefetcher.inflight(block)
+        try:
+            if inflight is not None:
+                metrics.inc("pexels_prefetch_hits_total")
+                # Shielded so a client hanging up doesn't cancel the prefetch
+                ids = await asyncio.shield(inflight)
+            else:
+                ids = await fetch_block(
+                    request.name, per_page, block_page, PEXELS_MAX_PACING_WAIT
+                )
+        except UpstreamUnavailable as unavailable:
+            ids = serve_stale(block, retry_after=unavailable.retry_after)
+            response.headers["X-Cache"] = "stale"
+
+    if sequential:
+        prefetch_next_block(request.name, request.count, request.page, block)
+    return ids[offset : offset + request.count]
+
+
+@app.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+def get_metrics():
+    update_breaker_metrics()
+    return metrics.render()
@@ -0,0 +1,26 @@
+from typing import Dict
+
+
+class Metrics:
+    """Counters and gauges rendered in Prometheus text format."""
+
+    def __init__(self):
+        self._counters: Dict[str, float] = {}
+        self._gauges: Dict[str, float] = {}
+
+    def inc(self, name: str, amount: float = 1) -> None:
+        self._counters[name] = self._counters.get(name, 0) + amount
+
+    def set(self, name: str, value: float) -> None:
+        self._gauges[name] = value
+
+    def render(self) -> str:
+        lines = []
+        for kind, values in (("counter", self._counters), ("gauge", self._gauges)):
+            for name, value in sorted(values.items()):
+                lines.append(f"# TYPE {name} {kind}")
+                lines.append(f"{name} {value:g}")
+        return "\n".join(lines) + "\n"
+
+
+metrics = Metrics()
@@ -1,7 +1,7 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class ImageSearchRequest(BaseModel):
     name: str
-    count: int  # Number of images per page
-    page: int  # Page number for pagination
+    count: int = Field(..., ge=1)  # Number of images per page
+    page: int = Field(..., ge=1)  # Page number for pagination
@@ -0,0 +1,56 @@
+import asyncio
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+from app.image_cache import SearchKey
+from app.metrics import metrics
+
+PagingKey = Tuple[str, int]  # (query, client page size)
+
+
+class Prefetcher:
+    """Spots clients paging through a search and fetches ahead of them.
+
+    Remembers the last page requested per (query, page size); when the next
+    request is exactly one page further the client is paging sequentially and
+    the following upstream page is worth fetching early. At most
+    ``max_inflight`` prefetches run at once and each upstream page is only
+    fetched once; requests for a page that is being prefetched wait for it.
+    """
+
+    def __init__(self, max_inflight: int = 2, max_tracked: int = 1000):
+        self.max_inflight = max_inflight
+        self.max_tracked = max_tracked
+        self._last_page: "OrderedDict[PagingKey, int]" = OrderedDict()
+        self._inflight: Dict[SearchKey, asyncio.Task] = {}
+
+    def observe(self, paging_key: PagingKey, page: int) -> bool:
+        """Record a page request; True if it continues a sequential walk."""
+        previous = self._last_page.pop(paging_key, None)
+        self._last_page[paging_key] = page
+        while len(self._last_page) > self.max_tracked:
+            self._last_page.popitem(last=False)
+        return previous == page - 1
+
+    def inflight(self, key: SearchKey) -> Optional[asyncio.Task]:
+        return self._inflight.get(key)
+
+    def schedule(self, key: SearchKey, fetch: Callable[[], Awaitable]) -> None:
+        if key in self._inflight:
+            return
+        if len(self._inflight) >= self.max_inflight:
+            metrics.inc("pexels_prefetch_skipped_total")
+            return
+        metrics.inc("pexels_prefetch_total")
+        task = asyncio.ensure_future(fetch())
+        self._inflight[key] = task
+        task.add_done_callback(lambda done: self._finished(key, done))
+
+    def _finished(self, key: SearchKey, task: asyncio.Task) -> None:
+        self._inflight.pop(key, None)
+        if not task.cancelled() and task.exception() is not None:
+            metrics.inc("pexels_prefetch_failed_total")
+
+    def cancel_all(self) -> None:
+        for task in list(self._inflight.values()):
+            task.cancel()
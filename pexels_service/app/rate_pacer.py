@@ -0,0 +1,71 @@
+import asyncio
+import math
+import time
+from typing import Mapping, Optional
+
+
+class RatePacer:
+    """Spreads the remaining Pexels quota evenly until the quota resets.
+
+    Pexels reports the quota on every response through ``X-Ratelimit-Remaining``
+    and ``X-Ratelimit-Reset`` (a UNIX timestamp). Requests run freely while
+    plenty of quota is left; once fewer than ``low_watermark`` remain they are
+    spaced ``time left / requests left`` apart instead of running into a 429.
+    """
+
+    def __init__(self, low_watermark: int = 100):
+        self.low_watermark = low_watermark
+        self.remaining: Optional[int] = None
+        self.reset_at: Optional[float] = None
+        self._next_slot = 0.0
+
+    def update(self, headers: Mapping[str, str]) -> None:
+        try:
+            self.remaining = int(headers["x-ratelimit-remaining"])
+            self.reset_at = float(headers["x-ratelimit-reset"])
+        except (KeyError, ValueError):
+            return
+
+    def _slot(self, now: float) -> float:
+        slot = max(now, self._next_slot)
+        if self.remaining == 0:
+            slot = max(slot, self.reset_at or now)
+        return slot
+
+    def retry_after(self) -> int:
+        """Whole seconds until the next request slot opens."""
+        now = time.time()
+        return max(1, math.ceil(self._slot(now) - now))
+
+    def _interval(self, now: float) -> float:
+        if self.remaining is None or self.reset_at is None or now >= self.reset_at:
+            return 0.0
+        if self.remaining > self.low_watermark:
+            return 0.0
+        if self.remaining <= 0:
+            return self.reset_at - now
+        return (self.reset_at - now) / self.remaining
+
+    async def acquire(self, max_wait: float) -> bool:
+        """Wait for the next request slot; False if it is more than max_wait away."""
+        now = time.time()
+        slot = self._slot(now)
+        if slot - now > max_wait:
+            return False
+        self._next_slot = slot + self._interval(now)
+        if self.remaining:
+            self.remaining -= 1  # until the next response reports the real count
+        if slot > now:
+            await asyncio.sleep(slot - now)
+        return True
+
+
+def rate_limited_for(headers: Mapping[str, str], default: float) -> float:
+    """How long a 429 asks us to back off, from ``Retry-After`` or the reset time."""
+    retry_after = headers.get("retry-after", "")
+    if retry_after.isdigit():
+        return float(retry_after)
+    try:
+        return max(0.0, float(headers["x-ratelimit-reset"]) - time.time())
+    except (KeyError, ValueError):
+        return default
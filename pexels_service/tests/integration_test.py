@@ -0,0 +1,291 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from app import main
+from app.circuit_breaker import BreakerState, CircuitBreaker
+from app.image_cache import ImageCache
+from app.prefetcher import Prefetcher
+from app.rate_pacer import RatePacer
+
+
+class FakePexels:
+    """Stand-in for the Pexels search API behind an ``httpx.MockTransport``."""
+
+    def __init__(self):
+        self.calls = []
+        self.status_code = 200
+        self.headers = {}
+        self.gates = {}  # upstream page -> asyncio.Event holding the response back
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        per_page = int(request.url.params["per_page"])
+        page = int(request.url.params["page"])
+        self.calls.append((per_page, page))
+        if page in self.gates:
+            await self.gates[page].wait()
+        photos = [{"id": page * 1000 + i} for i in range(per_page)]
+        return httpx.Response(
+            self.status_code, json={"photos": photos}, headers=self.headers
+        )
+
+
+@pytest.fixture
+def pexels(monkeypatch):
+    upstream = FakePexels()
+    monkeypatch.setattr(
+        main,
+        "http_client",
+        httpx.AsyncClient(transport=httpx.MockTransport(upstream)),
+        raising=False,
+    )
+    monkeypatch.setattr(main, "breaker", CircuitBreaker(min_calls=2, open_seconds=30))
+    monkeypatch.setattr(main, "pacer", RatePacer(low_watermark=10))
+    monkeypatch.setattr(main, "image_cache", ImageCache(max_entries=100))
+    monkeypatch.setattr(main, "prefetcher", Prefetcher(max_inflight=2))
+    return upstream
+
+
+def search(*requests):
+    """POST each (name, count, page) to /images in order, on one event loop."""
+
+    async def run():
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as client:
+            responses = []
+            for name, count, page in requests:
+                responses.append(
+                    await client.post(
+                        "/images", json={"name": name, "count": count, "page": page}
+                    )
+                )
+            return responses
+
+    return asyncio.run(run())
+
+
+# CircuitBreaker
+def test_breaker_opens_on_failure_ratio():
+    breaker = CircuitBreaker(failure_ratio=0.5, min_calls=4, open_seconds=30)
+    breaker.record_success(0.1)
+    breaker.record_failure()
+    breaker.record_success(0.1)
+    assert breaker.state == BreakerState.CLOSED
+
+    breaker.record_success(5.0)  # slower than slow_call_seconds: a failure
+    assert breaker.state == BreakerState.OPEN
+    assert not breaker.allow_request()
+    assert 29 <= breaker.retry_after() <= 30
+
+
+def test_breaker_half_open_probe_closes_or_reopens():
+    breaker = CircuitBreaker(min_calls=1, open_seconds=0)
+    breaker.record_failure()
+    assert breaker.state == BreakerState.OPEN
+
+    assert breaker.allow_request()  # the single probe
+    assert breaker.state == BreakerState.HALF_OPEN
+    assert not breaker.allow_request()
+    breaker.record_failure()
+    assert breaker.state == BreakerState.OPEN
+    assert breaker.trips == 2
+
+    assert breaker.allow_request()
+    breaker.record_success(0.1)
+    assert breaker.state == BreakerState.CLOSED
+    assert breaker.allow_request()
+
+
+def test_cancelled_probe_releases_breaker(pexels):
+    async def run():
+        main.breaker.trip(0)
+        pexels.gates[1] = asyncio.Event()
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as client:
+
+            def page():
+                return client.post(
+                    "/images", json={"name": "mojito", "count": 4, "page": 1}
+                )
+
+            probe = asyncio.ensure_future(page())
+            await asyncio.sleep(0.05)
+            assert main.breaker.state == BreakerState.HALF_OPEN
+            probe.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await probe
+
+            del pexels.gates[1]
+            response = await page()
+            assert response.status_code == 200
+            assert main.breaker.state == BreakerState.CLOSED
+
+    asyncio.run(run())
+
+
+# RatePacer
+def test_pacer_spaces_requests_below_low_watermark():
+    async def run():
+        pacer = RatePacer(low_watermark=10)
+        pacer.update({"x-ratelimit-remaining": "500", "x-ratelimit-reset": "0"})
+        assert await pacer.acquire(max_wait=0)
+        assert await pacer.acquire(max_wait=0)
+
+        reset = time.time() + 100
+        pacer.update({"x-ratelimit-remaining": "5", "x-ratelimit-reset": str(reset)})
+        assert await pacer.acquire(max_wait=0)
+        # 100 seconds left for 5 requests: the next slot is ~20s away
+        assert not await pacer.acquire(max_wait=1)
+        assert 19 <= pacer.retry_after() <= 21
+
+        pacer.update({"x-ratelimit-remaining": "0", "x-ratelimit-reset": str(reset)})
+        assert 99 <= pacer.retry_after() <= 100
+
+    asyncio.run(run())
+
+
+# ImageCache
+def test_image_cache_evicts_least_recently_used():
+    cache = ImageCache(max_entries=2)
+    cache.put(("mojito", 4, 1), [1])
+    cache.put(("lime", 4, 1), [2])
+    assert cache.get(("mojito", 4, 1)).ids == [1]
+    cache.put(("mint", 4, 1), [3])
+    assert cache.get(("lime", 4, 1)) is None
+    assert cache.get(("mojito", 4, 1)) is not None
+
+
+# @app.post("/images")
+def test_fetch_images_success(pexels):
+    first, second = search(("Mojito", 4, 1), ("mojito", 4, 1))
+    assert first.status_code == second.status_code == 200
+    assert first.json() == [1000, 1001, 1002, 1003]
+    assert second.headers["x-cache"] == "hit"
+    assert pexels.calls == [(16, 1)]
+
+
+def test_fetch_images_serves_stale_while_breaker_open(pexels, monkeypatch):
+    search(("mojito", 4, 1))
+    monkeypatch.setattr(main, "IMAGE_CACHE_TTL", 0)
+    main.breaker.trip(30)
+
+    (response,) = search(("mojito", 4, 1))
+    assert response.status_code == 200
+    assert response.headers["x-cache"] == "stale"
+    assert response.json() == [1000, 1001, 1002, 1003]
+    assert pexels.calls == [(16, 1)]
+
+
+def test_fetch_images_unavailable_without_cache(pexels):
+    main.breaker.trip(30)
+
+    (response,) = search(("mojito", 4, 1))
+    assert response.status_code == 503
+    assert 29 <= int(response.headers["retry-after"]) <= 30
+    assert pexels.calls == []
+
+
+def test_fetch_images_rate_limited_honours_retry_after(pexels):
+    pexels.status_code = 429
+    pexels.headers = {"Retry-After": "120"}
+
+    (response,) = search(("mojito", 4, 1))
+    assert response.status_code == 503
+    assert 119 <= int(response.headers["retry-after"]) <= 120
+    assert main.breaker.state == BreakerState.OPEN
+
+
+def test_fetch_images_paced_below_low_watermark(pexels):
+    pexels.headers = {
+        "X-Ratelimit-Remaining": "5",
+        "X-Ratelimit-Reset": str(int(time.time()) + 100),
+    }
+
+    responses = search(("mojito", 4, 1), ("lime", 4, 1), ("mint", 4, 1))
+    assert [r.status_code for r in responses] == [200, 200, 503]
+    # The third search waits for a slot ~20s away instead of calling Pexels
+    assert 19 <= int(responses[2].headers["retry-after"]) <= 21
+    assert len(pexels.calls) == 2
+
+
+# Larger upstream pages and prefetching
+def test_upstream_block_maps_client_pages():
+    assert main.upstream_block(4, 1) == (16, 1, 0)
+    assert main.upstream_block(4, 4) == (16, 1, 12)
+    assert main.upstream_block(4, 5) == (16, 2, 0)
+    assert main.upstream_block(50, 3) == (50, 3, 0)  # only one fits in 80
+
+
+def test_sequential_pages_share_upstream_calls(pexels):
+    responses = search(*[("mojito", 4, page) for page in range(1, 6)])
+    assert all(response.status_code == 200 for response in responses)
+    assert responses[4].json() == [2000, 2001, 2002, 2003]
+    assert pexels.calls == [(16, 1), (16, 2)]
+
+
+def test_last_page_prefetches_nothing(pexels):
+    responses = search(*[("mojito", 4, page) for page in range(1, 5)])
+    assert all(response.status_code == 200 for response in responses)
+    # Pages 1-4 are one upstream block and the UI stops at page 4
+    assert pexels.calls == [(16, 1)]
+
+
+def test_page_being_prefetched_waits_for_that_fetch(pexels, monkeypatch):
+    monkeypatch.setattr(main, "PREFETCH_MAX_PAGE", 8)
+
+    async def run():
+        pexels.gates[2] = asyncio.Event()
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as client:
+
+            def page(n):
+                return client.post(
+                    "/images", json={"name": "mojito", "count": 4, "page": n}
+                )
+
+            await page(3)
+            await page(4)  # sequential: prefetches upstream page 2
+            fifth = asyncio.ensure_future(page(5))
+            await asyncio.sleep(0.05)
+            assert not fifth.done()
+            assert pexels.calls == [(16, 1), (16, 2)]
+
+            pexels.gates[2].set()
+            response = await fifth
+            assert response.json() == [2000, 2001, 2002, 2003]
+            assert pexels.calls == [(16, 1), (16, 2)]
+
+    asyncio.run(run())
+
+
+def test_prefetcher_dedupes_and_caps_inflight():
+    async def run():
+        prefetcher = Prefetcher(max_inflight=1)
+        started = []
+
+        async def fetch(key):
+            started.append(key)
+            await asyncio.sleep(0.01)
+
+        assert not prefetcher.observe(("mojito", 4), 1)
+        assert prefetcher.observe(("mojito", 4), 2)
+        assert not prefetcher.observe(("mojito", 4), 4)
+
+        a, b = ("mojito", 16, 2), ("lime", 16, 2)
+        prefetcher.schedule(a, lambda: fetch(a))
+        prefetcher.schedule(a, lambda: fetch(a))  # already in flight
+        prefetcher.schedule(b, lambda: fetch(b))  # over max_inflight
+        assert prefetcher.inflight(b) is None
+        await prefetcher.inflight(a)
+        assert started == [a]
+        assert prefetcher.inflight(a) is None
+
+    asyncio.run(run())